@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import base64
-import io
-from typing import Dict
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
-from flask import Flask, Response, flash, redirect, render_template, request, send_file, url_for
+from flask import Flask, Response, flash, redirect, render_template, request, url_for
 
 from glyph_mapper import (
     apply_word_mapping,
@@ -14,13 +16,74 @@ from glyph_mapper import (
     generate_word_occurrences,
     summarise_vocabulary,
 )
-from glyph_mapper.logger import start_new_run
+from glyph_mapper.logger import get_logger, start_new_run
+
+
+class PDFUploadCache:
+    """Bounded in-process store for uploaded PDFs awaiting remapping.
+
+    Keeps the PDF server-side between ``/analyze`` and ``/remap`` so the page
+    only round-trips a short token instead of the base64-encoded document.
+    Entries live in this process's memory, so the app must run as a single
+    process: with several workers a ``/remap`` can land on a worker that never
+    saw the upload and the session reads as expired.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        max_bytes: int = 128 * 1024 * 1024,
+        ttl_seconds: float = 10 * 60,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def put(self, pdf_bytes: bytes) -> str:
+        token = secrets.token_urlsafe(16)
+        with self._lock:
+            self._evict_expired()
+            self._entries[token] = (time.monotonic() + self.ttl_seconds, pdf_bytes)
+            self._total_bytes += len(pdf_bytes)
+            # Drop the oldest uploads first, but always keep the one just stored
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+            ):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+        return token
+
+    def get(self, token: str) -> Optional[bytes]:
+        with self._lock:
+            self._evict_expired()
+            entry = self._entries.get(token)
+        return entry[1] if entry is not None else None
+
+    def pop(self, token: str) -> None:
+        """Forget ``token`` once its upload has been remapped."""
+        with self._lock:
+            entry = self._entries.pop(token, None)
+            if entry is not None:
+                self._total_bytes -= len(entry[1])
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        while self._entries:
+            token, (expires_at, pdf_bytes) = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            del self._entries[token]
+            self._total_bytes -= len(pdf_bytes)
 
 
 def create_app() -> Flask:
     app = Flask(__name__)
     app.secret_key = "dev-secret-key"  # Replace with an environment variable in production.
     app.config["MAX_CONTENT_LENGTH"] = 25 * 1024 * 1024  # 25 MB uploads
+    pdf_cache = PDFUploadCache()
 
     @app.get("/")
     def index() -> str:
@@ -38,19 +101,23 @@ def create_app() -> Flask:
             flash("This doesn't look like a valid PDF file.")
             return redirect(url_for("index"))
 
-        preview_text = extract_text_preview(pdf_bytes)
-        word_index = generate_word_occurrences(pdf_bytes)
-        top_words = summarise_vocabulary(word_index, top_n=60)
+        try:
+            preview_text = extract_text_preview(pdf_bytes)
+            word_index = generate_word_occurrences(pdf_bytes)
+            top_words = summarise_vocabulary(word_index, top_n=60)
+        finally:
+            # This route does not finalize a run; write out its buffered records now
+            get_logger().flush()
         if not preview_text:
             flash("No extractable text found. The document may be scanned or image-only.")
 
-        encoded_pdf = base64.b64encode(pdf_bytes).decode("utf-8")
+        pdf_token = pdf_cache.put(pdf_bytes)
 
         return render_template(
             "mapping.html",
             preview=preview_text,
             top_words=top_words,
-            pdf_data=encoded_pdf,
+            pdf_token=pdf_token,
         )
 
     @app.post("/remap")
@@ -58,45 +125,34 @@ def create_app() -> Flask:
         # Start a new logging run
         logger = start_new_run()
         
-        encoded_pdf = request.form.get("pdf_data")
-        if not encoded_pdf:
+        pdf_token = request.form.get("pdf_token")
+        pdf_bytes = pdf_cache.get(pdf_token) if pdf_token else None
+        if pdf_bytes is None:
             flash("Upload session expired. Please submit the PDF again.")
             return redirect(url_for("index"))
 
-        try:
-            pdf_bytes = base64.b64decode(encoded_pdf)
-        except (ValueError, TypeError):
-            flash("Could not decode the uploaded PDF payload.")
-            return redirect(url_for("index"))
-
         originals = request.form.getlist("original")
         replacements = request.form.getlist("replacement")
         processing_mode = request.form.get("processing_mode", "overlay")
         if processing_mode not in {"overlay", "font", "ocr"}:
             processing_mode = "overlay"
         
-        mapping: Dict[str, str] = {
-            original: replacement
-            for original, replacement in zip(originals, replacements)
-            if original.strip() and replacement.strip()
-        }
+        pairs = ((original.strip(), replacement.strip()) for original, replacement in zip(originals, replacements))
+        mapping: Dict[str, str] = {original: replacement for original, replacement in pairs if original and replacement}
 
         logger.logger.info(f"Starting PDF remapping with {len(mapping)} mappings in {processing_mode} mode")
         
         try:
             remapped_pdf = apply_word_mapping(pdf_bytes, mapping, mode=processing_mode)
-            output = io.BytesIO(remapped_pdf)
-            output.seek(0)
+            pdf_cache.pop(pdf_token)
             
             # Create a more descriptive filename with run ID and mode
             filename = f"glyph-remapped-{logger.run_id}-{processing_mode}.pdf"
             
-            return send_file(
-                output,
-                mimetype="application/pdf",
-                download_name=filename,
-                as_attachment=True,
-            )
+            # Serve the bytes directly rather than re-reading them through a file wrapper
+            response = Response(remapped_pdf, mimetype="application/pdf")
+            response.headers.set("Content-Disposition", "attachment", filename=filename)
+            return response
         except Exception as e:
             logger.log_error(e, "Flask remap_pdf route")
             logger.finalize_run()
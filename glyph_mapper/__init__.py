@@ -4,6 +4,7 @@ from .pdf_processor import (
     apply_image_ocr_mapping,
     apply_image_overlay_mapping,
     apply_word_mapping,
+    clear_pattern_cache,
     extract_text_preview,
     generate_word_occurrences,
     summarise_vocabulary,
@@ -16,4 +17,5 @@ __all__ = [
     "apply_word_mapping",
     "apply_image_overlay_mapping",
     "apply_image_ocr_mapping",
+    "clear_pattern_cache",
 ]
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List, Optional, Pattern, Tuple
+from bisect import bisect_right
+from itertools import chain
+from typing import Dict, FrozenSet, List, Optional, Pattern, Tuple
 
 from PyPDF2.generic import ArrayObject, NumberObject, TextStringObject
 
 from .logger import get_logger
-from .tj_array_processor_v2 import TJArrayProcessorV2
+from .tj_array_processor_v2 import (
+    _SPACE_THRESHOLD,
+    TJArrayProcessorV2,
+    _clean_special_chars,
+    _decode_text_item,
+)
 
 
 class CrossArrayProcessor:
@@ -18,6 +25,19 @@ class CrossArrayProcessor:
     This handles cases where patterns like "0.9:" are split across multiple
     TJ operations: ['=', '0'] in one array and ['9:', ...] in another.
     """
+
+    # Decimal patterns where the decimal point is missing entirely.
+    # Real case: "= 0 : 9:" should be "0.9:"
+    # The separator alternation covers "= 0 : 9:" (decimal point missing),
+    # "= 0 9:" (space instead of decimal) and "= 09:" (no space) in one pass.
+    _SPLIT_DECIMAL_RE = re.compile(
+        r'(?:=\s*)?(\d)(?:\s*:\s*|\s+|\s*)(\d+):',
+        re.IGNORECASE,
+    )
+    # Shape of the mapping keys _SPLIT_DECIMAL_RE can reconstruct
+    _DECIMAL_KEY_RE = re.compile(r'\d\.\d+:')
+
+    _WINDOW_SIZE = 3  # Matches may span up to 3 consecutive TJ operations
     
     def __init__(self, pattern: Pattern[str], mapping: Dict[str, str], mapping_cf: Dict[str, str]):
         self.pattern = pattern
@@ -25,6 +45,47 @@ class CrossArrayProcessor:
         self.mapping_cf = mapping_cf
         self.logger = get_logger()
         self.v2_processor = TJArrayProcessorV2(pattern, mapping, mapping_cf)
+        # Exact keys win over case-folded ones, matching _resolve_replacement's lookup order
+        self._combined = {**mapping_cf, **mapping}
+        self._first_chars = self._build_first_chars(mapping, mapping_cf)
+        self._has_decimal_keys = any(self._DECIMAL_KEY_RE.fullmatch(key) for key in self._combined)
+    
+    @staticmethod
+    def _build_first_chars(mapping: Dict[str, str], mapping_cf: Dict[str, str]) -> Optional[FrozenSet[str]]:
+        """Collect every character a case-insensitive match can start with.
+        
+        Returns None when the prefilter cannot be applied (e.g. a key starts
+        with whitespace, which kerning adjustments may produce).
+        """
+        first_chars = set()
+        for key in chain(mapping, mapping_cf):
+            if not key or key[0].isspace():
+                return None
+            head = key[0]
+            first_chars.update((head, head.lower(), head.upper(), head.casefold()))
+        return frozenset(first_chars)
+    
+    def _may_match(self, text: str) -> bool:
+        """Cheap prefilter: False when no mapping key can start anywhere in ``text``."""
+        return self._first_chars is None or not self._first_chars.isdisjoint(text)
+    
+    def _array_may_match(self, array_obj: ArrayObject) -> bool:
+        """Return True when the V2 processor could find a match in ``array_obj``.
+        
+        Builds the same combined text the V2 processor sees (cleaned fragments
+        plus kerning spaces) and runs the first-character prefilter and a single
+        regex search over it, so arrays without candidates skip the V2 rebuild.
+        """
+        if not self.pattern:
+            return False
+        pieces = []
+        for item in array_obj:
+            if isinstance(item, TextStringObject):
+                pieces.append(_clean_special_chars(_decode_text_item(item)))
+            elif isinstance(item, NumberObject) and float(item) <= _SPACE_THRESHOLD:
+                pieces.append(' ')
+        text = ''.join(pieces)
+        return self._may_match(text) and self.pattern.search(text) is not None
     
     def process_content_operations(self, operations: List[Tuple]) -> Tuple[List[Tuple], bool]:
         """
@@ -48,22 +109,22 @@ class CrossArrayProcessor:
         return operations_after_cross, v2_modified or cross_modified
     
     def _apply_v2_processor(self, operations: List[Tuple]) -> Tuple[List[Tuple], bool]:
-        """Apply V2 processor to individual TJ arrays and Tj operations."""
-        modified_operations = []
-        any_modified = False
+        """Apply V2 processor to individual TJ arrays and Tj operations.
         
-        for operands, operator in operations:
+        The output list is only materialized at the first rewritten operation;
+        pages without matches return ``operations`` itself.
+        """
+        modified_operations: Optional[List[Tuple]] = None
+        
+        for index, operation in enumerate(operations):
+            operands, operator = operation
+            replacement_op = None
             if operator == b"TJ" and operands:
                 array_obj = operands[0]
-                if isinstance(array_obj, ArrayObject):
+                if isinstance(array_obj, ArrayObject) and self._array_may_match(array_obj):
                     processed_array, array_modified = self.v2_processor.process_tj_array(array_obj)
                     if array_modified:
-                        modified_operations.append(([processed_array], operator))
-                        any_modified = True
-                    else:
-                        modified_operations.append((operands, operator))
-                else:
-                    modified_operations.append((operands, operator))
+                        replacement_op = ([processed_array], operator)
             elif operator == b"Tj" and operands:
                 # Handle single text string operations carefully
                 # Only process if we detect patterns that need replacement
@@ -71,150 +132,159 @@ class CrossArrayProcessor:
                 text = str(text_obj)
                 
                 # Check if this text contains any of our target patterns
-                if self.pattern and self.pattern.search(text):
+                if self.pattern and self._may_match(text) and self.pattern.search(text):
                     # Apply replacement directly to the text
                     modified_text = self._apply_pattern_replacement(text)
                     if modified_text != text:
-                        from PyPDF2.generic import TextStringObject
-                        modified_operations.append(([TextStringObject(modified_text)], operator))
-                        any_modified = True
+                        replacement_op = ([TextStringObject(modified_text)], operator)
                         self.logger.logger.info(f"Tj replacement: '{text}' → '{modified_text}'")
-                    else:
-                        modified_operations.append((operands, operator))
-                else:
-                    modified_operations.append((operands, operator))
-            else:
-                modified_operations.append((operands, operator))
-        
-        return modified_operations, any_modified
+            
+            if replacement_op is not None:
+                if modified_operations is None:
+                    modified_operations = list(operations[:index])
+                modified_operations.append(replacement_op)
+            elif modified_operations is not None:
+                modified_operations.append(operation)
+        
+        if modified_operations is None:
+            return operations, False
+        return modified_operations, True
     
     def _apply_cross_array_processing(self, operations: List[Tuple]) -> Tuple[List[Tuple], bool]:
         """Apply cross-array pattern matching and replacement."""
         if not self.pattern:
             return operations, False
         
-        # Find TJ operations and build sliding windows
+        # Find TJ operations with text, extracting each array's text only once
         tj_operations = []
+        array_texts = []
         for i, (operands, operator) in enumerate(operations):
             if operator == b"TJ" and operands:
                 array_obj = operands[0]
                 if isinstance(array_obj, ArrayObject):
-                    tj_operations.append((i, array_obj))
+                    array_text = self._extract_array_text(array_obj)
+                    if array_text:
+                        tj_operations.append((i, array_obj))
+                        array_texts.append(array_text)
         
         if len(tj_operations) < 2:
             # Need at least 2 TJ operations for cross-array patterns
             return operations, False
         
         # Find cross-array matches
-        cross_matches = self._find_cross_array_matches(tj_operations)
+        cross_matches = self._find_cross_array_matches(tj_operations, array_texts)
         
         if not cross_matches:
             return operations, False
 
-        # Apply replacements to the matched operations
-        modified_operations = list(operations)
-        any_modified = False
+        # Record replacements as sparse overrides keyed by operation index
+        patched: Dict[int, Tuple] = {}
 
         # Process matches in reverse order to maintain indices
         for match in reversed(cross_matches):
-            success = self._apply_cross_array_replacement(modified_operations, match)
-            if success:
-                any_modified = True
+            self._apply_cross_array_replacement(operations, patched, match)
+        
+        if not patched:
+            return operations, False
         
-        return modified_operations, any_modified
+        return [patched.get(i, operation) for i, operation in enumerate(operations)], True
     
-    def _find_cross_array_matches(self, tj_operations: List[Tuple[int, ArrayObject]]) -> List[Dict]:
-        """Find patterns that span across multiple TJ operations."""
+    def _find_cross_array_matches(
+        self, tj_operations: List[Tuple[int, ArrayObject]], array_texts: List[str]
+    ) -> List[Dict]:
+        """Find patterns that span across multiple TJ operations.
+        
+        ``array_texts`` holds the extracted text of each entry in ``tj_operations``.
+        """
         matches = []
         
-        # Use sliding window approach
-        window_size = 3  # Look at up to 3 consecutive TJ operations
+        # Scan the combined text of all TJ operations once and map each match
+        # back to the arrays it covers via their start offsets
+        combined_text, starts = self._build_combined_text(array_texts)
         
-        for i in range(len(tj_operations) - 1):
-            window_operations = tj_operations[i:i + window_size]
-            window_text = self._build_window_text(window_operations)
-            
-            self.logger.logger.debug(f"Cross-array window {i}: {repr(window_text)}")
-            
-            # Check for pattern matches in the window
-            pattern_matches = list(self.pattern.finditer(window_text))
+        self.logger.logger.debug(f"Cross-array text: {repr(combined_text)}")
+        
+        # Check for pattern matches in the combined text
+        pattern_matches = list(self.pattern.finditer(combined_text))
+        
+        # Also check for decimal number patterns that might be split
+        decimal_matches = self._find_split_decimal_patterns(combined_text, tj_operations)
+        
+        # Combine both types of matches
+        all_matches = pattern_matches + decimal_matches
+        
+        for match in all_matches:
+            if hasattr(match, 'span'):
+                # Regular regex match
+                start, end = match.span()
+                matched_text = match.group(0)
+            else:
+                # Custom decimal match
+                start, end = match['span']
+                matched_text = match['text']
             
-            # Also check for decimal number patterns that might be split
-            decimal_matches = self._find_split_decimal_patterns(window_text, window_operations)
+            first = bisect_right(starts, start) - 1
+            last = bisect_right(starts, end - 1) - 1
+            if last == first or last - first >= self._WINDOW_SIZE:
+                # Single-array matches are handled by the V2 processor
+                continue
             
-            # Combine both types of matches
-            all_matches = pattern_matches + decimal_matches
+            replacement = self._resolve_replacement(matched_text)
             
-            for match in all_matches:
-                if hasattr(match, 'span'):
-                    # Regular regex match
-                    start, end = match.span()
-                    matched_text = match.group(0)
-                else:
-                    # Custom decimal match
-                    start, end = match['span']
-                    matched_text = match['text']
-                
-                replacement = self._resolve_replacement(matched_text)
+            if replacement and replacement != matched_text:
+                window_start = starts[first]
+                window_end = starts[last + 1] - 1 if last + 1 < len(starts) else len(combined_text)
+                window_text = combined_text[window_start:window_end]
+                self.logger.logger.info(f"Cross-array match: '{matched_text}' → '{replacement}' in window {first}")
                 
-                if replacement and replacement != matched_text:
-                    self.logger.logger.info(f"Cross-array match: '{matched_text}' → '{replacement}' in window {i}")
-                    
-                    matches.append({
-                        'window_start': i,
-                        'window_operations': window_operations,
-                        'match_start': start,
-                        'match_end': end,
-                        'original': matched_text,
-                        'replacement': replacement,
-                        'window_text': window_text
-                    })
+                matches.append({
+                    'window_start': first,
+                    'window_operations': tj_operations[first:last + 1],
+                    'match_start': start - window_start,
+                    'match_end': end - window_start,
+                    'original': matched_text,
+                    'replacement': replacement,
+                    'window_text': window_text
+                })
         
         return matches
     
     def _find_split_decimal_patterns(self, window_text: str, window_operations: List) -> List[Dict]:
         """Find decimal patterns that are split across arrays (missing decimal point)."""
         decimal_matches = []
-        
-        # Look for patterns where decimal point is missing entirely
-        # Real case: "= 0 : 9:" should be "0.9:"
-        split_decimal_patterns = [
-            r'(?:=\s*)?(\d)\s*:\s*(\d+):',  # Matches "= 0 : 9:" (decimal point missing)
-            r'(?:=\s*)?(\d)\s+(\d+):',      # Matches "= 0 9:" (space instead of decimal)
-            r'(?:=\s*)?(\d)\s*(\d+):',      # Matches "= 09:" (no space)
-        ]
-        
-        for pattern_str in split_decimal_patterns:
-            pattern = re.compile(pattern_str, re.IGNORECASE)
-            for match in pattern.finditer(window_text):
-                # Reconstruct the decimal number
-                digit1 = match.group(1)
-                digit2 = match.group(2)
-                reconstructed = f"{digit1}.{digit2}:"
-                
-                self.logger.logger.debug(f"Found split decimal: '{match.group(0)}' → '{reconstructed}'")
-                
-                # Check if this reconstructed pattern is in our mappings
-                if reconstructed in self.mapping or reconstructed.lower() in self.mapping_cf:
-                    decimal_matches.append({
-                        'span': match.span(),
-                        'text': reconstructed,
-                        'original_match': match.group(0)
-                    })
+        if not self._has_decimal_keys:
+            # No reconstructed decimal could ever be found in the mappings
+            return decimal_matches
+        
+        for match in self._SPLIT_DECIMAL_RE.finditer(window_text):
+            # Reconstruct the decimal number
+            digit1 = match.group(1)
+            digit2 = match.group(2)
+            reconstructed = f"{digit1}.{digit2}:"
+            
+            self.logger.logger.debug(f"Found split decimal: '{match.group(0)}' → '{reconstructed}'")
+            
+            # Check if this reconstructed pattern is in our mappings
+            if reconstructed in self._combined:
+                decimal_matches.append({
+                    'span': match.span(),
+                    'text': reconstructed,
+                    'original_match': match.group(0)
+                })
         
         return decimal_matches
     
-    def _build_window_text(self, window_operations: List[Tuple[int, ArrayObject]]) -> str:
-        """Build combined text from a window of TJ operations."""
-        text_parts = []
+    def _build_combined_text(self, array_texts: List[str]) -> Tuple[str, List[int]]:
+        """Join per-array texts and return the start offset of each array."""
+        starts = []
+        cursor = 0
         
-        for _, array_obj in window_operations:
-            array_text = self._extract_array_text(array_obj)
-            if array_text:
-                text_parts.append(array_text)
+        for array_text in array_texts:
+            starts.append(cursor)
+            cursor += len(array_text) + 1
         
         # Join with spaces to approximate the actual spacing
-        return ' '.join(text_parts)
+        return ' '.join(array_texts), starts
     
     def _extract_array_text(self, array_obj: ArrayObject) -> str:
         """Extract text from a TJ array, cleaning special characters."""
@@ -222,17 +292,17 @@ class CrossArrayProcessor:
         
         for item in array_obj:
             if isinstance(item, TextStringObject):
-                text = str(item)
-                # Apply the same cleaning as V2 processor
-                cleaned_text = self.v2_processor._clean_special_chars(text)
-                text_elements.append(cleaned_text)
+                # Apply the same (memoised) cleaning as V2 processor; TextStringObject
+                # is already a str, so no str() copy is needed first
+                text_elements.append(_clean_special_chars(item))
             elif isinstance(item, NumberObject):
+                adjustment = float(item)
                 # Add space for significant negative adjustments
-                if float(item) <= -120:
+                if adjustment <= -120:
                     text_elements.append(' ')
                 # For positive NumberObjects, they might represent missing characters
                 # In some PDFs, decimal points are represented as positioning numbers
-                elif 0 < float(item) < 10 and len(str(item)) == 1:
+                elif 0 < adjustment < 10 and len(str(item)) == 1:
                     # This might be a missing decimal point in decimal number contexts
                     pass  # For now, ignore small positive numbers
         
@@ -240,13 +310,17 @@ class CrossArrayProcessor:
     
     def _resolve_replacement(self, token: str) -> Optional[str]:
         """Resolve replacement for a token."""
-        replacement = self.mapping.get(token)
+        replacement = self._combined.get(token)
         if replacement is not None:
             return replacement
-        return self.mapping_cf.get(token.casefold())
+        folded = token.casefold()
+        if folded == token:
+            # Already case-folded, so the lookup above covered mapping_cf too
+            return None
+        return self.mapping_cf.get(folded)
     
-    def _apply_cross_array_replacement(self, operations: List[Tuple], match: Dict) -> bool:
-        """Apply a cross-array replacement to the operations list."""
+    def _apply_cross_array_replacement(self, operations: List[Tuple], patched: Dict[int, Tuple], match: Dict) -> bool:
+        """Apply a cross-array replacement, recording changed operations in ``patched``."""
         try:
             window_ops = match['window_operations']
             original = match['original']
@@ -257,16 +331,16 @@ class CrossArrayProcessor:
             # 2. Modify the second array: "9:" → "0:" (add decimal point)
             
             if '.' in original and ':' in original and len(window_ops) >= 2:
-                return self._apply_decimal_cross_array_replacement(operations, match)
+                return self._apply_decimal_cross_array_replacement(operations, patched, match)
             else:
                 # Fallback to simple replacement in first array
-                return self._apply_simple_cross_array_replacement(operations, match)
+                return self._apply_simple_cross_array_replacement(operations, patched, match)
 
         except Exception as e:
             self.logger.log_error(e, f"cross_array_replacement")
             return False
     
-    def _apply_decimal_cross_array_replacement(self, operations: List[Tuple], match: Dict) -> bool:
+    def _apply_decimal_cross_array_replacement(self, operations: List[Tuple], patched: Dict[int, Tuple], match: Dict) -> bool:
         """Apply decimal number replacement across two arrays."""
         window_ops = match['window_operations']
         original = match['original']  # e.g., "0.9:"
@@ -285,9 +359,9 @@ class CrossArrayProcessor:
         # Extract digits from the actual replacement string
         # For "0.9:" → "9.0:", we want first digit 0→9, second digit 9→0
         # For "1.2:" → "0.2:", we want first digit 1→0, second digit 2→2 (no change)
-        import re
-        orig_digits = re.findall(r'\d', original)
-        repl_digits = re.findall(r'\d', replacement)
+        # str.isdecimal() matches exactly what r'\d' does, without the regex engine
+        orig_digits = [char for char in original if char.isdecimal()]
+        repl_digits = [char for char in replacement if char.isdecimal()]
         
         if len(orig_digits) != 2 or len(repl_digits) != 2:
             return False
@@ -299,18 +373,18 @@ class CrossArrayProcessor:
 
         # Modify the first array: replace "0" with "9"
         first_op_index = window_ops[0][0]
-        operands, operator = operations[first_op_index]
+        operands, operator = patched.get(first_op_index, operations[first_op_index])
         if operator == b"TJ" and operands:
             array_obj = operands[0]
             if isinstance(array_obj, ArrayObject):
                 new_array = self._replace_digit_in_array(array_obj, orig_digit1, repl_digit1)
                 if new_array:
-                    operations[first_op_index] = ([new_array], operator)
+                    patched[first_op_index] = ([new_array], operator)
                     success = True
 
         # Modify the second array: replace "9:" with ".0:"
         second_op_index = window_ops[1][0]
-        operands, operator = operations[second_op_index]
+        operands, operator = patched.get(second_op_index, operations[second_op_index])
         if operator == b"TJ" and operands:
             array_obj = operands[0]
             if isinstance(array_obj, ArrayObject):
@@ -318,7 +392,7 @@ class CrossArrayProcessor:
                     array_obj, orig_digit2, repl_digit2
                 )
                 if new_array:
-                    operations[second_op_index] = ([new_array], operator)
+                    patched[second_op_index] = ([new_array], operator)
                     success = True
 
         if success:
@@ -326,14 +400,14 @@ class CrossArrayProcessor:
         
         return success
     
-    def _apply_simple_cross_array_replacement(self, operations: List[Tuple], match: Dict) -> bool:
+    def _apply_simple_cross_array_replacement(self, operations: List[Tuple], patched: Dict[int, Tuple], match: Dict) -> bool:
         """Apply simple replacement in the first array."""
         window_ops = match['window_operations']
         original = match['original']
         replacement = match['replacement']
         
         target_op_index = window_ops[0][0]
-        operands, operator = operations[target_op_index]
+        operands, operator = patched.get(target_op_index, operations[target_op_index])
         if operator == b"TJ" and operands:
             array_obj = operands[0]
             if isinstance(array_obj, ArrayObject):
@@ -342,7 +416,7 @@ class CrossArrayProcessor:
                 )
 
                 if modified_array:
-                    operations[target_op_index] = ([modified_array], operator)
+                    patched[target_op_index] = ([modified_array], operator)
                     self.logger.logger.debug(f"Applied simple cross-array replacement to operation {target_op_index}")
                     return True
         
@@ -357,113 +431,101 @@ class CrossArrayProcessor:
         For decimal number cases like "0.9:" split across arrays,
         we need to properly distribute the replacement text.
         """
-        new_array = ArrayObject()
-        
         # For split decimal patterns like "0.9:" → "9.0:", we need to:
         # 1. Replace the digit in the first array with the replacement digit
         # 2. Handle the decimal point and remaining parts appropriately
         
+        # The replacement plan only depends on the match, so work it out once
+        decimal_swap = None
+        if '.' in original and ':' in original:
+            # This is a decimal pattern like "0.9:" → "9.0:"
+            orig_parts = original.split('.')
+            repl_parts = replacement.split('.')
+            
+            if len(orig_parts) == 2 and len(repl_parts) == 2:
+                decimal_swap = (orig_parts[0], repl_parts[0])  # ("0", "9")
+        
+        # Fallback: replace first digit with first replacement digit
+        orig_digits = ''.join(c for c in original if c.isdigit())
+        repl_digits = ''.join(c for c in replacement if c.isdigit())
+        first_orig_digit = orig_digits[:1]
+        digit_table = (
+            str.maketrans(first_orig_digit, repl_digits[0]) if orig_digits and repl_digits else None
+        )
+        
+        # Collect items in a plain list and wrap them in an ArrayObject once
+        items: List = []
         for item in array_obj:
             if isinstance(item, TextStringObject):
                 text = str(item)
                 
-                # Handle decimal number replacements specifically
-                if '.' in original and ':' in original:
-                    # This is a decimal pattern like "0.9:" → "9.0:"
-                    orig_parts = original.split('.')
-                    repl_parts = replacement.split('.')
-                    
-                    if len(orig_parts) == 2 and len(repl_parts) == 2:
-                        orig_digit = orig_parts[0]  # "0"
-                        repl_digit = repl_parts[0]  # "9"
-                        
-                        # If this text contains the first digit, replace it
-                        if orig_digit in text:
-                            modified_text = text.replace(orig_digit, repl_digit)
-                            new_array.append(TextStringObject(modified_text))
-                            continue
-                
-                # Fallback: general digit replacement
-                if any(char.isdigit() for char in text) and any(char.isdigit() for char in original):
-                    # Extract digits from original and replacement
-                    orig_digits = ''.join(c for c in original if c.isdigit())
-                    repl_digits = ''.join(c for c in replacement if c.isdigit())
-                    
-                    if orig_digits and repl_digits:
-                        # Replace first digit with first replacement digit
-                        first_orig_digit = orig_digits[0]
-                        first_repl_digit = repl_digits[0]
-                        
-                        if first_orig_digit in text:
-                            modified_text = text.replace(first_orig_digit, first_repl_digit)
-                            new_array.append(TextStringObject(modified_text))
-                            continue
+                # If this text contains the first digit, replace it
+                if decimal_swap is not None and decimal_swap[0] in text:
+                    items.append(TextStringObject(text.replace(*decimal_swap)))
+                    continue
                 
-                new_array.append(item)
-            else:
-                new_array.append(item)
+                if digit_table is not None and first_orig_digit in text:
+                    items.append(TextStringObject(text.translate(digit_table)))
+                    continue
+            
+            items.append(item)
         
-        return new_array
+        return ArrayObject(items)
     
     def _replace_digit_in_array(self, array_obj: ArrayObject, old_digit: str, new_digit: str) -> Optional[ArrayObject]:
         """Replace a digit in an array object."""
-        new_array = ArrayObject()
+        items: List = []
         modified = False
+        digit_table = str.maketrans(old_digit, new_digit)
         
         for item in array_obj:
             if isinstance(item, TextStringObject):
                 text = str(item)
                 if old_digit in text:
-                    modified_text = text.replace(old_digit, new_digit)
-                    new_array.append(TextStringObject(modified_text))
+                    items.append(TextStringObject(text.translate(digit_table)))
                     modified = True
-                else:
-                    new_array.append(item)
-            else:
-                new_array.append(item)
+                    continue
+            items.append(item)
         
-        return new_array if modified else None
+        return ArrayObject(items) if modified else None
     
     def _replace_digit_with_decimal_in_array(self, array_obj: ArrayObject, old_digit: str, new_digit: str) -> Optional[ArrayObject]:
         """Replace a digit with a decimal format (e.g., '9:' → '.0:')."""
-        new_array = ArrayObject()
+        items: List = []
         modified = False
+        old_with_colon = old_digit + ':'
+        new_with_colon = '.' + new_digit + ':'
         
         for item in array_obj:
             if isinstance(item, TextStringObject):
                 text = str(item)
                 # Look for the pattern like "9:" and replace with ".0:"
-                if old_digit + ':' in text:
-                    modified_text = text.replace(old_digit + ':', '.' + new_digit + ':')
-                    new_array.append(TextStringObject(modified_text))
+                if old_with_colon in text:
+                    items.append(TextStringObject(text.replace(old_with_colon, new_with_colon)))
                     modified = True
-                elif old_digit in text and not '.' in text:
+                    continue
+                if old_digit in text and '.' not in text:
                     # Only add decimal if there isn't one already
-                    modified_text = text.replace(old_digit, '.' + new_digit)
-                    new_array.append(TextStringObject(modified_text))
+                    items.append(TextStringObject(text.replace(old_digit, '.' + new_digit)))
                     modified = True
-                else:
-                    new_array.append(item)
-            else:
-                new_array.append(item)
+                    continue
+            items.append(item)
         
-        return new_array if modified else None
+        return ArrayObject(items) if modified else None
     
     def _apply_pattern_replacement(self, text: str) -> str:
         """Apply simple pattern replacement to text."""
         if not self.pattern:
             return text
         
-        # Apply replacements using the pattern
-        result = text
-        for match in reversed(list(self.pattern.finditer(text))):
-            original = match.group(0)
-            replacement = self._resolve_replacement(original)
-            if replacement and replacement != original:
-                start, end = match.span()
-                result = result[:start] + replacement + result[end:]
-        
-        return result
+        # Apply replacements using the pattern in a single left-to-right pass
+        return self.pattern.sub(self._substitute_match, text)
+    
+    def _substitute_match(self, match: re.Match) -> str:
+        """Return the replacement for a pattern match, or the match itself when unmapped."""
+        original = match.group(0)
+        replacement = self._resolve_replacement(original)
+        return replacement if replacement else original
 
 
 def process_content_stream_with_cross_array_support(
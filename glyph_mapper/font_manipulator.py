@@ -2,20 +2,140 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import io
 import os
+import re
 import tempfile
-from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+import threading
+from typing import BinaryIO, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
-from fontTools.ttLib import TTFont
+import fitz  # PyMuPDF
+from fontTools.ttLib import TTFont, newTable
+from fontTools.ttLib.sfnt import SFNTWriter
 from fontTools.ttLib.tables._c_m_a_p import CmapSubtable
-from PyPDF2 import PdfReader
-from PyPDF2.generic import DictionaryObject, NameObject, StreamObject
+from PyPDF2.generic import ArrayObject, DictionaryObject, NameObject, NumberObject, StreamObject
 
 from .logger import get_logger
 
 
+# Cached fonts are shared between threads and decompile tables lazily from one
+# file handle, so every read of a cached font holds this lock. Cached fonts are
+# never modified; remapped cmaps are built as new tables.
+_FONT_LOCK = threading.RLock()
+
+# Per-thread scratch buffer reused for every remapped font write
+_scratch = threading.local()
+
+
+def _scratch_buffer() -> io.BytesIO:
+    """Return this thread's emptied scratch buffer; read results with getvalue()."""
+    buffer = getattr(_scratch, "buffer", None)
+    if buffer is None:
+        buffer = _scratch.buffer = io.BytesIO()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return buffer
+
+
+@dataclasses.dataclass(frozen=True)
+class FontArtifact:
+    """Font file bytes plus the metrics needed for its PDF font descriptor."""
+
+    data: bytes
+    bbox: Tuple[int, int, int, int]
+    italic_angle: int
+    ascent: int
+    descent: int
+    cap_height: int
+
+
+def _font_artifact(font: TTFont, data: bytes) -> FontArtifact:
+    """Read descriptor metrics from ``font`` (head, OS/2 and post tables)."""
+    with _FONT_LOCK:
+        return _read_font_artifact(font, data)
+
+
+def _read_font_artifact(font: TTFont, data: bytes) -> FontArtifact:
+    head_table = font['head']
+    os2_table = font.get('OS/2')
+    post_table = font.get('post')
+
+    return FontArtifact(
+        data=data,
+        bbox=(
+            int(head_table.xMin),
+            int(head_table.yMin),
+            int(head_table.xMax),
+            int(head_table.yMax)
+        ),
+        italic_angle=int(post_table.italicAngle) if post_table else 0,
+        ascent=int(os2_table.sTypoAscender) if os2_table else 1000,
+        descent=int(os2_table.sTypoDescender) if os2_table else -200,
+        cap_height=int(os2_table.sCapHeight) if os2_table and hasattr(os2_table, 'sCapHeight') else 700,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_font_cached(font_path: str, mtime: float) -> TTFont:
+    return TTFont(font_path)
+
+
+def _load_font(font_path: str) -> TTFont:
+    """
+    Return a parsed font for ``font_path``, reusing it across calls.
+
+    The cache is keyed on the file's modification time so edited fonts are
+    parsed again. The font is shared: read it only while holding
+    ``_FONT_LOCK`` and never modify it.
+    """
+    return _load_font_cached(font_path, os.path.getmtime(font_path))
+
+
+# Unicode subtables in order of preference: Windows BMP, Windows full
+# Unicode, then the platform-0 (Unicode) equivalents
+_UNICODE_CMAP_IDS = ((3, 1), (3, 10), (0, 3), (0, 4))
+
+
+def _unicode_subtable(font: TTFont) -> Optional[CmapSubtable]:
+    """Return the font's preferred Unicode cmap subtable, or None if it has none."""
+    cmap = font['cmap']
+    for platform_id, encoding_id in _UNICODE_CMAP_IDS:
+        subtable = cmap.getcmap(platform_id, encoding_id)
+        if subtable is not None:
+            return subtable
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _font_characters_cached(font_path: str, mtime: float) -> Optional[FrozenSet[str]]:
+    font = _load_font_cached(font_path, mtime)
+    with _FONT_LOCK:
+        best_cmap = font['cmap'].getBestCmap()
+    return frozenset(map(chr, best_cmap)) if best_cmap is not None else None
+
+
+def _font_characters(font_path: str) -> Optional[FrozenSet[str]]:
+    """Return the characters mapped by the font's Unicode BMP cmap, or None if it has none."""
+    return _font_characters_cached(font_path, os.path.getmtime(font_path))
+
+
+def _write_with_new_cmap(font: TTFont, cmap_data: bytes, output: BinaryIO) -> None:
+    """
+    Write ``font`` to ``output`` with ``cmap_data`` as its cmap table.
+
+    Every other table is copied byte for byte from the source file, which
+    skips fontTools' table compilers (the post table alone dominates a full
+    ``font.save``). The writer still fixes up the head checksum adjustment.
+    """
+    reader = font.reader
+    writer = SFNTWriter(output, len(reader.tables), reader.sfntVersion, reader.flavor)
+    for tag in reader.keys():
+        writer[tag] = cmap_data if tag == 'cmap' else reader[tag]
+    writer.close()
+
+
 def create_remapped_font(font_path: str, char_mappings: Dict[str, str]) -> bytes:
     """
     Create a new font with remapped character glyphs.
@@ -27,46 +147,91 @@ def create_remapped_font(font_path: str, char_mappings: Dict[str, str]) -> bytes
     Returns:
         Modified font as bytes
     """
-    font = TTFont(font_path)
-    
-    # Get the character map table
-    cmap = font['cmap']
-    
-    # Find the Unicode BMP subtable (Platform ID 3, Encoding ID 1)
-    unicode_cmap = None
-    for table in cmap.tables:
-        if table.platformID == 3 and table.platEncID == 1:
-            unicode_cmap = table
-            break
-    
-    if unicode_cmap is None:
-        raise ValueError("No Unicode BMP character map found in font")
+    return create_remapped_font_artifact(font_path, char_mappings).data
+
+
+def create_remapped_font_artifact(font_path: str, char_mappings: Dict[str, str]) -> FontArtifact:
+    """
+    Create a remapped font together with its descriptor metrics.
     
-    # Create mappings between Unicode code points
-    code_point_mappings = {}
-    for orig_char, repl_char in char_mappings.items():
-        if len(orig_char) == 1 and len(repl_char) == 1:
-            orig_code = ord(orig_char)
-            repl_code = ord(repl_char)
-            code_point_mappings[orig_code] = repl_code
+    Only the cmap changes, so the metrics are read from the already parsed
+    source font and ``embed_font_in_pdf`` needs no second read or parse.
     
-    # Get glyph names for the characters we want to swap
-    glyph_swaps = {}
-    for orig_code, repl_code in code_point_mappings.items():
-        orig_glyph = unicode_cmap.cmap.get(orig_code)
-        repl_glyph = unicode_cmap.cmap.get(repl_code)
+    Args:
+        font_path: Path to the source TTF font file
+        char_mappings: Dictionary mapping original characters to replacement characters
         
-        if orig_glyph and repl_glyph:
-            glyph_swaps[orig_code] = repl_glyph
+    Returns:
+        FontArtifact holding the modified font bytes and metrics
+    """
+    return _remapped_font_cached(
+        font_path, os.path.getmtime(font_path), frozenset(char_mappings.items())
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _remapped_font_cached(
+    font_path: str, mtime: float, char_mappings: FrozenSet[Tuple[str, str]]
+) -> FontArtifact:
+    # The same font and mapping are typically remapped for many PDFs, and the
+    # artifact is immutable, so whole results are reused
+    font = _load_font_cached(font_path, mtime)
     
-    # Apply the glyph swaps to the character map
-    for orig_code, new_glyph in glyph_swaps.items():
-        unicode_cmap.cmap[orig_code] = new_glyph
+    output = _scratch_buffer()
+    with _FONT_LOCK:
+        # Prefer the Unicode BMP subtable (Platform ID 3, Encoding ID 1)
+        unicode_cmap = _unicode_subtable(font)
+        
+        if unicode_cmap is None:
+            raise ValueError("No Unicode character map found in font")
+        
+        # Get glyph names for the single characters we want to swap, in one pass
+        unicode_map = unicode_cmap.cmap
+        glyph_swaps = {
+            ord(orig_char): unicode_map[ord(repl_char)]
+            for orig_char, repl_char in char_mappings
+            if len(orig_char) == 1 and len(repl_char) == 1
+            and ord(orig_char) in unicode_map and ord(repl_char) in unicode_map
+        }
+        
+        # Save the font with a remapped cmap; the cached font stays untouched
+        cmap_data = _remapped_cmap_table(font['cmap'], glyph_swaps).compile(font)
+        _write_with_new_cmap(font, cmap_data, output)
+        return _read_font_artifact(font, output.getvalue())
+
+
+def _remapped_cmap_table(cmap, glyph_swaps: Dict[int, str]):
+    """
+    Return a new cmap table whose Unicode subtables apply ``glyph_swaps``.
     
-    # Save the modified font to bytes
-    output = io.BytesIO()
-    font.save(output)
-    return output.getvalue()
+    Every Unicode subtable is remapped so renderers agree whichever one they
+    pick. Subtables decoded from the same data share one dict, and their
+    copies share one remapped dict so the compiler still writes it once.
+    Other subtables (and format 14 variation sequences) are reused as is.
+    """
+    remapped = newTable('cmap')
+    remapped.tableVersion = cmap.tableVersion
+    remapped.tables = []
+    remapped_by_id: Dict[int, Dict[int, str]] = {}
+    for table in cmap.tables:
+        if not table.isUnicode() or table.format == 14:
+            remapped.tables.append(table)
+            continue
+        
+        original_cmap = table.cmap
+        remapped_cmap = remapped_by_id.get(id(original_cmap))
+        if remapped_cmap is None:
+            # Apply the glyph swaps to the character map with one merge
+            swaps = {code: glyph for code, glyph in glyph_swaps.items() if code in original_cmap}
+            remapped_cmap = remapped_by_id[id(original_cmap)] = {**original_cmap, **swaps}
+        
+        subtable = CmapSubtable.newSubtable(table.format)
+        subtable.platformID = table.platformID
+        subtable.platEncID = table.platEncID
+        subtable.language = table.language
+        subtable.cmap = remapped_cmap
+        remapped.tables.append(subtable)
+    return remapped
 
 
 def analyze_font_characters(font_path: str, characters: Set[str]) -> Dict[str, bool]:
@@ -80,58 +245,51 @@ def analyze_font_characters(font_path: str, characters: Set[str]) -> Dict[str, b
     Returns:
         Dictionary mapping characters to their availability in the font
     """
-    font = TTFont(font_path)
-    
-    # Get the character map table
-    cmap = font['cmap']
-    
-    # Find the Unicode BMP subtable
-    unicode_cmap = None
-    for table in cmap.tables:
-        if table.platformID == 3 and table.platEncID == 1:
-            unicode_cmap = table
-            break
+    font_characters = _font_characters(font_path)
     
-    if unicode_cmap is None:
+    if font_characters is None:
         return {char: False for char in characters}
     
-    # Check availability of each character
-    availability = {}
-    for char in characters:
-        if len(char) == 1:
-            code_point = ord(char)
-            availability[char] = code_point in unicode_cmap.cmap
-        else:
-            availability[char] = False
+    # Check availability with one set intersection; multi-character strings
+    # can never be members, so they stay False
+    availability = dict.fromkeys(characters, False)
+    availability.update(dict.fromkeys(font_characters.intersection(characters), True))
     
     return availability
 
 
+_PROJECT_DEJAVU_SANS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fonts", "DejaVuSans.ttf"
+)
+
+_SYSTEM_FONTS = {
+    'Arial': "/System/Library/Fonts/Supplemental/Arial.ttf",
+    'TimesNewRoman': "/System/Library/Fonts/Supplemental/Times New Roman.ttf",
+    'Helvetica': "/System/Library/Fonts/Helvetica.ttc",
+    'Geneva': "/System/Library/Fonts/Geneva.ttf"
+}
+
+
 def get_available_fonts() -> Dict[str, str]:
     """
     Get a dictionary of available fonts with their paths.
     Returns fonts in priority order: DejaVuSans, Arial, Times New Roman, fallback.
+
+    The filesystem is only probed on the first call; later calls get a copy
+    of the cached result.
     """
-    fonts = {}
-
-    # Project fonts
-    project_fonts_dir = Path(__file__).parent.parent / "fonts"
-    if (project_fonts_dir / "DejaVuSans.ttf").exists():
-        fonts['DejaVuSans'] = str(project_fonts_dir / "DejaVuSans.ttf")
-
-    # System fonts
-    system_fonts = {
-        'Arial': "/System/Library/Fonts/Supplemental/Arial.ttf",
-        'TimesNewRoman': "/System/Library/Fonts/Supplemental/Times New Roman.ttf",
-        'Helvetica': "/System/Library/Fonts/Helvetica.ttc",
-        'Geneva': "/System/Library/Fonts/Geneva.ttf"
-    }
+    return dict(_discover_fonts())
 
-    for name, path in system_fonts.items():
-        if os.path.exists(path):
-            fonts[name] = path
 
-    return fonts
+@functools.lru_cache(maxsize=1)
+def _discover_fonts() -> Dict[str, str]:
+    candidates = {
+        # Project fonts
+        'DejaVuSans': _PROJECT_DEJAVU_SANS,
+        # System fonts
+        **_SYSTEM_FONTS,
+    }
+    return {name: path for name, path in candidates.items() if os.path.exists(path)}
 
 
 def extract_font_info_from_pdf(pdf_bytes: bytes) -> Dict[str, any]:
@@ -142,7 +300,6 @@ def extract_font_info_from_pdf(pdf_bytes: bytes) -> Dict[str, any]:
         Dictionary with font information including names and types
     """
     logger = get_logger()
-    reader = PdfReader(io.BytesIO(pdf_bytes))
 
     font_info = {
         'fonts': [],
@@ -151,27 +308,27 @@ def extract_font_info_from_pdf(pdf_bytes: bytes) -> Dict[str, any]:
     }
 
     try:
-        for page in reader.pages:
-            if '/Resources' in page and '/Font' in page['/Resources']:
-                fonts_dict = page['/Resources']['/Font']
-
-                for font_key, font_obj in fonts_dict.items():
-                    if isinstance(font_obj, DictionaryObject):
-                        font_data = {
-                            'key': str(font_key),
-                            'subtype': str(font_obj.get('/Subtype', '')),
-                            'basefont': str(font_obj.get('/BaseFont', ''))
-                        }
-
-                        # Check if font is embedded
-                        if '/FontDescriptor' in font_obj:
-                            font_data['embedded'] = True
-                            font_info['has_embedded_fonts'] = True
-
-                        font_info['fonts'].append(font_data)
-                        font_info['font_names'].add(font_data['basefont'])
-
-                break  # Only check first page for performance
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        try:
+            # Only check first page for performance
+            fonts = doc[0].get_fonts(full=True) if doc.page_count else []
+        finally:
+            doc.close()
+
+        for _xref, ext, subtype, basefont, resource_name, _encoding, _referencer in fonts:
+            font_data = {
+                'key': f"/{resource_name}",
+                'subtype': f"/{subtype}",
+                'basefont': f"/{basefont}"
+            }
+
+            # Check if font is embedded ("n/a" means no font file in the PDF)
+            if ext != "n/a":
+                font_data['embedded'] = True
+                font_info['has_embedded_fonts'] = True
+
+            font_info['fonts'].append(font_data)
+            font_info['font_names'].add(font_data['basefont'])
 
         logger.logger.info(f"Found {len(font_info['fonts'])} fonts in PDF: {font_info['font_names']}")
     except Exception as e:
@@ -197,11 +354,15 @@ def select_best_font_for_pdf(pdf_bytes: bytes) -> str:
     # Priority order
     priority_order = ['DejaVuSans', 'Arial', 'TimesNewRoman', 'Helvetica', 'Geneva']
 
-    # Try to match PDF fonts with available fonts
-    pdf_font_names_lower = {name.lower() for name in pdf_font_info['font_names']}
+    # Try to match PDF fonts with available fonts; lower-case the candidates
+    # once rather than for every PDF font, and visit PDF fonts in a stable order
+    available_lower = [
+        (name.lower(), name, path) for name, path in available_fonts.items()
+    ]
+    pdf_font_names_lower = sorted({name.lower() for name in pdf_font_info['font_names']})
     for pdf_font in pdf_font_names_lower:
-        for available_name, available_path in available_fonts.items():
-            if available_name.lower() in pdf_font or pdf_font in available_name.lower():
+        for available_key, available_name, available_path in available_lower:
+            if available_key in pdf_font or pdf_font in available_key:
                 logger.logger.info(f"Matched PDF font '{pdf_font}' with '{available_name}'")
                 return available_path
 
@@ -220,11 +381,32 @@ def select_best_font_for_pdf(pdf_bytes: bytes) -> str:
     raise RuntimeError("No suitable fonts found on system")
 
 
+# English letters from most to least frequent; higher score = more frequent
+_LETTER_FREQUENCY_ORDER = "etaoinshrdlcumwfgypbvkjxqz"
+_LETTER_FREQUENCY = {
+    char: len(_LETTER_FREQUENCY_ORDER) - rank for rank, char in enumerate(_LETTER_FREQUENCY_ORDER)
+}
+
+
+def _char_frequency(char: str) -> int:
+    """Score ``char`` by English letter frequency; non-letters score 0."""
+    return _LETTER_FREQUENCY.get(char.lower(), 0)
+
+
+def _by_frequency(chars: Set[str]) -> List[str]:
+    """Order ``chars`` from most to least frequent, ties broken by code point."""
+    return sorted(chars, key=lambda char: (-_char_frequency(char), char))
+
+
 def create_character_mapping_from_words(word_mappings: Dict[str, str]) -> Dict[str, str]:
     """
     Convert word mappings to character mappings by analyzing character frequency.
     Uses intelligent heuristics to handle different-length words.
 
+    Words containing more frequent English letters are mapped first, so those
+    characters win any conflicts, and unmatched characters of different-length
+    words are paired by frequency rank.
+
     Args:
         word_mappings: Dictionary mapping original words to replacement words
 
@@ -234,13 +416,17 @@ def create_character_mapping_from_words(word_mappings: Dict[str, str]) -> Dict[s
     logger = get_logger()
     char_mappings = {}
 
-    for original, replacement in word_mappings.items():
-        orig_lower = original.lower()
-        repl_lower = replacement.lower()
+    ordered_mappings = sorted(
+        word_mappings.items(),
+        key=lambda item: max(map(_char_frequency, item[0]), default=0),
+        reverse=True,
+    )
 
+    for original, replacement in ordered_mappings:
         if len(original) == len(replacement):
-            # Same length: direct character mapping
-            for orig_char, repl_char in zip(original, replacement):
+            # Same length: direct character mapping, visiting each distinct
+            # character pair once in order of first appearance
+            for orig_char, repl_char in dict.fromkeys(zip(original, replacement)):
                 if orig_char != repl_char:
                     # Avoid conflicts: only map if not already mapped
                     if orig_char not in char_mappings:
@@ -253,19 +439,17 @@ def create_character_mapping_from_words(word_mappings: Dict[str, str]) -> Dict[s
         else:
             # Different lengths: find character substitutions using simple heuristic
             # Map unique characters that appear in original but not in replacement
-            orig_chars = set(original)
-            repl_chars = set(replacement)
-
             # Find characters that only appear in one word
-            only_in_orig = orig_chars - repl_chars
-            only_in_repl = repl_chars - orig_chars
+            only_in_orig = set(original).difference(replacement)
+            only_in_repl = set(replacement).difference(original)
 
-            # Create mappings for unique characters if counts match
+            # Create mappings for unique characters if counts match, pairing
+            # characters of the same frequency rank
             if len(only_in_orig) == len(only_in_repl) and len(only_in_orig) > 0:
-                for orig_char, repl_char in zip(sorted(only_in_orig), sorted(only_in_repl)):
+                for orig_char, repl_char in zip(_by_frequency(only_in_orig), _by_frequency(only_in_repl)):
                     if orig_char not in char_mappings:
                         char_mappings[orig_char] = repl_char
-                        logger.logger.debug(f"Inferred mapping: '{orig_char}' → '{repl_char}'")
+                        logger.logger.debug("Inferred mapping: '%s' → '%s'", orig_char, repl_char)
 
     logger.logger.info(f"Created {len(char_mappings)} character mappings from {len(word_mappings)} word mappings")
     return char_mappings
@@ -282,130 +466,163 @@ def create_font_descriptor(font_path: str, font_name: str) -> DictionaryObject:
     Returns:
         DictionaryObject containing font descriptor
     """
-    from PyPDF2.generic import NumberObject, ArrayObject
-
     # Load font to extract metrics
-    font = TTFont(font_path)
-
-    # Get font metrics from head and OS/2 tables
-    head_table = font['head']
-    os2_table = font.get('OS/2')
-    post_table = font.get('post')
-
-    # Font bounding box
-    bbox = [
-        int(head_table.xMin),
-        int(head_table.yMin),
-        int(head_table.xMax),
-        int(head_table.yMax)
-    ]
+    metrics = _font_artifact(_load_font(font_path), b"")
 
     # Create font descriptor
     descriptor = DictionaryObject({
         NameObject("/Type"): NameObject("/FontDescriptor"),
         NameObject("/FontName"): NameObject(f"/{font_name}"),
         NameObject("/Flags"): NumberObject(32),  # Symbolic font
-        NameObject("/FontBBox"): ArrayObject([NumberObject(x) for x in bbox]),
-        NameObject("/ItalicAngle"): NumberObject(int(post_table.italicAngle) if post_table else 0),
-        NameObject("/Ascent"): NumberObject(int(os2_table.sTypoAscender) if os2_table else 1000),
-        NameObject("/Descent"): NumberObject(int(os2_table.sTypoDescender) if os2_table else -200),
-        NameObject("/CapHeight"): NumberObject(int(os2_table.sCapHeight) if os2_table and hasattr(os2_table, 'sCapHeight') else 700),
+        NameObject("/FontBBox"): ArrayObject([NumberObject(x) for x in metrics.bbox]),
+        NameObject("/ItalicAngle"): NumberObject(metrics.italic_angle),
+        NameObject("/Ascent"): NumberObject(metrics.ascent),
+        NameObject("/Descent"): NumberObject(metrics.descent),
+        NameObject("/CapHeight"): NumberObject(metrics.cap_height),
         NameObject("/StemV"): NumberObject(80),  # Approximate stem width
     })
 
     return descriptor
 
 
-def embed_font_in_pdf(pdf_bytes: bytes, remapped_font_path: str, char_mappings: Dict[str, str]) -> bytes:
+def _font_descriptor_source(font: FontArtifact, font_name: str) -> str:
+    """Return the PDF source of the font descriptor for ``font``."""
+    bbox = " ".join(str(value) for value in font.bbox)
+    return (
+        f"<</Type/FontDescriptor/FontName/{font_name}"
+        "/Flags 32"  # Symbolic font
+        f"/FontBBox[{bbox}]/ItalicAngle {font.italic_angle}"
+        f"/Ascent {font.ascent}/Descent {font.descent}/CapHeight {font.cap_height}"
+        "/StemV 80>>"  # Approximate stem width
+    )
+
+
+_FIRST_NAME_RE = re.compile(r"<<\s*/([^\s/<>\[\]()]+)")
+
+
+def _indirect_xref(value: str) -> int:
+    """Return the object number of an ``"N 0 R"`` reference string."""
+    return int(value.split()[0])
+
+
+def _page_font_resources(doc: "fitz.Document", page: "fitz.Page") -> Tuple[int, str]:
+    """
+    Locate the /Font resource dictionary of ``page``.
+
+    PyMuPDF cannot set keys along a path that crosses indirect objects, so the
+    path is resolved one level at a time.
+
+    Returns:
+        Tuple of (xref holding the dictionary, key path prefix inside that xref)
+    """
+    kind, value = doc.xref_get_key(page.xref, "Resources")
+    if kind == "null":
+        # Resources may be inherited from the page tree; give the page its own entry
+        owner = page.xref
+        while kind == "null":
+            parent_kind, parent = doc.xref_get_key(owner, "Parent")
+            if parent_kind != "xref":
+                kind, value = "dict", "<<>>"
+                break
+            owner = _indirect_xref(parent)
+            kind, value = doc.xref_get_key(owner, "Resources")
+        doc.xref_set_key(page.xref, "Resources", value)
+
+    if kind == "xref":
+        resources_xref, prefix = _indirect_xref(value), ""
+    else:
+        resources_xref, prefix = page.xref, "Resources/"
+
+    kind, value = doc.xref_get_key(resources_xref, f"{prefix}Font")
+    if kind == "xref":
+        return _indirect_xref(value), ""
+    if kind == "null":
+        doc.xref_set_key(resources_xref, f"{prefix}Font", "<<>>")
+    return resources_xref, f"{prefix}Font/"
+
+
+def embed_font_in_pdf(
+    pdf_bytes: bytes, remapped_font: Union[str, FontArtifact], char_mappings: Dict[str, str]
+) -> bytes:
     """
     Embed a custom remapped font into PDF and replace original fonts.
     Preserves all non-text content including images, annotations, etc.
 
     Args:
         pdf_bytes: Original PDF bytes
-        remapped_font_path: Path to the remapped TTF font file
+        remapped_font: FontArtifact from ``create_remapped_font_artifact``, or a
+            path to the remapped TTF font file
         char_mappings: Character mappings that were applied
 
     Returns:
         Modified PDF with embedded remapped font
     """
-    from PyPDF2 import PdfReader, PdfWriter
-    from PyPDF2.generic import (
-        ArrayObject,
-        DictionaryObject,
-        NumberObject,
-        StreamObject
-    )
-
     logger = get_logger()
-    reader = PdfReader(io.BytesIO(pdf_bytes))
-    writer = PdfWriter()
 
-    # Read font file
-    with open(remapped_font_path, 'rb') as f:
-        font_file_bytes = f.read()
+    if not isinstance(remapped_font, FontArtifact):
+        # Read font file
+        with open(remapped_font, 'rb') as f:
+            remapped_font = _font_artifact(_load_font(remapped_font), f.read())
 
+    font_file_bytes = remapped_font.data
     font_name = "RemappedFont"
 
     logger.logger.info(f"Embedding font '{font_name}' into PDF")
 
-    # Create font file stream
-    font_stream = StreamObject()
-    font_stream._data = font_file_bytes
-    font_stream.update({
-        NameObject("/Length"): NumberObject(len(font_file_bytes)),
-        NameObject("/Length1"): NumberObject(len(font_file_bytes)),
-    })
-
-    # Create font descriptor
-    descriptor = create_font_descriptor(remapped_font_path, font_name)
-    descriptor[NameObject("/FontFile2")] = font_stream
-
-    # Create font dictionary
-    font_dict = DictionaryObject({
-        NameObject("/Type"): NameObject("/Font"),
-        NameObject("/Subtype"): NameObject("/TrueType"),
-        NameObject("/BaseFont"): NameObject(f"/{font_name}"),
-        NameObject("/FontDescriptor"): descriptor,
-        NameObject("/Encoding"): NameObject("/WinAnsiEncoding"),
-    })
-
-    # Process each page, preserving ALL content
-    for page_num, page in enumerate(reader.pages):
-        # Ensure resources exist
-        if "/Resources" not in page:
-            page[NameObject("/Resources")] = DictionaryObject()
-
-        resources = page["/Resources"]
-
-        # Ensure Font resources exist
-        if "/Font" not in resources:
-            resources[NameObject("/Font")] = DictionaryObject()
-
-        # Replace ALL fonts with our remapped font
-        # This ensures uniform rendering with the character mappings applied
-        font_resources = resources["/Font"]
-
-        # Get existing font keys
-        existing_fonts = list(font_resources.keys())
-
-        # Replace first font or add new one
-        if existing_fonts:
-            # Replace the first font (usually F1 or similar)
-            primary_font_key = existing_fonts[0]
-            font_resources[primary_font_key] = font_dict
-            logger.logger.debug(f"Page {page_num + 1}: Replaced font '{primary_font_key}' with remapped font")
-        else:
-            # No existing fonts, add as F1
-            font_resources[NameObject("/F1")] = font_dict
-            logger.logger.debug(f"Page {page_num + 1}: Added remapped font as /F1")
-
-        # Preserve ALL page content: images, annotations, metadata, etc.
-        # PyPDF2 automatically preserves these when we add the page
-        writer.add_page(page)
-
-    # Write output
-    output = io.BytesIO()
-    writer.write(output)
-    logger.logger.info(f"Successfully embedded font into PDF ({len(output.getvalue())} bytes)")
-    return output.getvalue()
\ No newline at end of file
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        # Create font file stream; the objects are shared by every page
+        font_file_xref = doc.get_new_xref()
+        doc.update_object(font_file_xref, f"<</Length1 {len(font_file_bytes)}>>")
+        doc.update_stream(font_file_xref, font_file_bytes)
+
+        # Create font descriptor
+        descriptor_xref = doc.get_new_xref()
+        doc.update_object(descriptor_xref, _font_descriptor_source(remapped_font, font_name))
+        doc.xref_set_key(descriptor_xref, "FontFile2", f"{font_file_xref} 0 R")
+
+        # Create font dictionary
+        font_xref = doc.get_new_xref()
+        doc.update_object(
+            font_xref,
+            f"<</Type/Font/Subtype/TrueType/BaseFont/{font_name}"
+            f"/FontDescriptor {descriptor_xref} 0 R/Encoding/WinAnsiEncoding>>",
+        )
+
+        # Pages often share one /Font dictionary; patch each dictionary once
+        patched_font_dicts: Set[Tuple[int, str]] = set()
+
+        # Process each page, preserving ALL content
+        for page_num, page in enumerate(doc):
+            # Replace ALL fonts with our remapped font
+            # This ensures uniform rendering with the character mappings applied
+            fonts_xref, fonts_path = _page_font_resources(doc, page)
+            if (fonts_xref, fonts_path) in patched_font_dicts:
+                logger.logger.debug("Page %d: Shares an already remapped font dictionary", page_num + 1)
+                continue
+            patched_font_dicts.add((fonts_xref, fonts_path))
+
+            if fonts_path:
+                fonts_source = doc.xref_get_key(fonts_xref, fonts_path.rstrip("/"))[1]
+            else:
+                fonts_source = doc.xref_object(fonts_xref, compressed=True)
+            first_font = _FIRST_NAME_RE.match(fonts_source)
+
+            # Replace first font or add new one
+            if first_font:
+                # Replace the first font (usually F1 or similar)
+                primary_font_key = first_font.group(1)
+                doc.xref_set_key(fonts_xref, f"{fonts_path}{primary_font_key}", f"{font_xref} 0 R")
+                logger.logger.debug("Page %d: Replaced font '/%s' with remapped font", page_num + 1, primary_font_key)
+            else:
+                # No existing fonts, add as F1
+                doc.xref_set_key(fonts_xref, f"{fonts_path}F1", f"{font_xref} 0 R")
+                logger.logger.debug("Page %d: Added remapped font as /F1", page_num + 1)
+
+        # Write output; images, annotations and metadata are left untouched
+        pdf_data = doc.tobytes(garbage=4, deflate=True)
+    finally:
+        doc.close()
+
+    logger.logger.info(f"Successfully embedded font into PDF ({len(pdf_data)} bytes)")
+    return pdf_data
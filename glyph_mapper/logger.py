@@ -2,11 +2,18 @@
 
 import json
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:  # Optional faster JSON encoder for run metadata
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency not installed
+    orjson = None
+
 # Create logs directory
 LOGS_DIR = Path("/Users/ashishrajshekhar/codex_code_glyph/logs")
 RUNS_DIR = Path("/Users/ashishrajshekhar/codex_code_glyph/runs")
@@ -14,6 +21,14 @@ RUNS_DIR = Path("/Users/ashishrajshekhar/codex_code_glyph/runs")
 LOGS_DIR.mkdir(exist_ok=True)
 RUNS_DIR.mkdir(exist_ok=True)
 
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the stdlib encoder does not know (timestamps are stored as datetimes)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 class PDFProcessingLogger:
     """Logger for tracking PDF processing operations with detailed steps."""
     
@@ -37,7 +52,12 @@ class PDFProcessingLogger:
             '%(asctime)s | %(levelname)8s | %(funcName)20s:%(lineno)4d | %(message)s'
         )
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        # Buffer only the per-operation DEBUG records; any INFO or higher record
+        # flushes the buffer (in order), so nothing important waits in memory
+        self._buffered_handler = logging.handlers.MemoryHandler(
+            capacity=4096, flushLevel=logging.INFO, target=file_handler
+        )
+        self.logger.addHandler(self._buffered_handler)
         
         # Console handler for important messages
         console_handler = logging.StreamHandler()
@@ -46,10 +66,12 @@ class PDFProcessingLogger:
         console_handler.setFormatter(console_formatter)
         self.logger.addHandler(console_handler)
         
-        # Initialize run metadata
+        # Initialize run metadata; step and error timestamps are perf_counter_ns()
+        # readings, converted to wall-clock datetimes relative to start in finalize_run
+        self._start_ns = time.perf_counter_ns()
         self.run_metadata = {
             "run_id": self.run_id,
-            "start_time": datetime.now().isoformat(),
+            "start_time": datetime.now(),
             "mode": None,
             "mappings": {},
             "steps": [],
@@ -92,60 +114,62 @@ class PDFProcessingLogger:
         # Save full text to file
         text_file = self.run_dir / "extracted_text.txt"
         text_file.write_text(text, encoding='utf-8')
-        self.logger.debug(f"Full extracted text saved to: {text_file}")
+        self.logger.debug("Full extracted text saved to: %s", text_file)
     
     def log_pattern_building(self, words: List[str], pattern_str: str, ignore_case: bool):
         """Log regex pattern construction."""
         self.logger.info(f"Building regex pattern for {len(words)} words (ignore_case={ignore_case})")
-        self.logger.debug(f"Words to match: {words}")
-        self.logger.debug(f"Compiled pattern: {pattern_str}")
+        self.logger.debug("Words to match: %s", words)
+        self.logger.debug("Compiled pattern: %s", pattern_str)
     
     def log_word_occurrences(self, word: str, count: int):
         """Log word occurrence counts."""
-        self.logger.debug(f"Word '{word}': {count} occurrences found")
+        self.logger.debug("Word '%s': %d occurrences found", word, count)
     
     def log_text_segment_analysis(self, text: str, segments: Optional[List], original: str, replacement: str):
         """Log detailed text segmentation analysis."""
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         if segments is None:
-            self.logger.debug(f"No matches found for '{original}' in text: {repr(text[:100])}")
+            if debug:
+                self.logger.debug("No matches found for '%s' in text: %r", original, text[:100])
             return
         
-        self.logger.debug(f"Text segmentation for '{original}' → '{replacement}':")
-        self.logger.debug(f"  Original text: {repr(text)}")
-        self.logger.debug(f"  Segments: {segments}")
+        if debug:
+            self.logger.debug("Text segmentation for '%s' → '%s':", original, replacement)
+            self.logger.debug("  Original text: %r", text)
+            self.logger.debug("  Segments: %s", segments)
         
         # Show what will change
-        rebuilt = []
-        changes = []
-        for segment_text, repl in segments:
-            if repl is not None:
-                rebuilt.append(repl)
-                changes.append(f"'{segment_text}' → '{repl}'")
-            else:
-                rebuilt.append(segment_text)
+        changes = [
+            f"'{segment_text}' → '{repl}'" for segment_text, repl in segments if repl is not None
+        ]
         
         if changes:
-            final_text = "".join(rebuilt)
-            self.logger.info(f"Text replacement in segment: {changes}")
-            self.logger.debug(f"  Result: {repr(final_text)}")
-        else:
-            self.logger.debug(f"  No changes made to this segment")
+            self.logger.info("Text replacement in segment: %s", changes)
+            if debug:
+                final_text = "".join(
+                    segment_text if repl is None else repl for segment_text, repl in segments
+                )
+                self.logger.debug("  Result: %r", final_text)
+        elif debug:
+            self.logger.debug("  No changes made to this segment")
     
     def log_content_stream_operation(self, operator: bytes, operands: List, page_num: int, op_index: int):
         """Log PDF content stream operations."""
-        self.logger.debug(f"Page {page_num}, Op {op_index}: {operator} with {len(operands)} operands")
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        self.logger.debug("Page %d, Op %d: %s with %d operands", page_num, op_index, operator, len(operands))
         
-        if operator in [b"Tj", b"TJ"]:
-            # Log text operations specifically
-            if operator == b"Tj" and operands:
-                text = str(operands[0])
-                self.logger.debug(f"  Tj text: {repr(text)}")
-            elif operator == b"TJ" and operands:
-                from PyPDF2.generic import ArrayObject, TextStringObject
-                array_obj = operands[0]
-                if isinstance(array_obj, ArrayObject):
-                    text_elements = [str(item) for item in array_obj if isinstance(item, TextStringObject)]
-                    self.logger.debug(f"  TJ array texts: {text_elements}")
+        # Log text operations specifically
+        if operator == b"Tj" and operands:
+            self.logger.debug("  Tj text: %r", str(operands[0]))
+        elif operator == b"TJ" and operands:
+            from PyPDF2.generic import ArrayObject, TextStringObject
+            array_obj = operands[0]
+            if isinstance(array_obj, ArrayObject):
+                text_elements = [str(item) for item in array_obj if isinstance(item, TextStringObject)]
+                self.logger.debug("  TJ array texts: %s", text_elements)
     
     def log_replacement_attempt(self, original_text: str, pattern_str: str, mapping: Dict[str, str], result: Optional[str]):
         """Log individual text replacement attempts."""
@@ -155,10 +179,10 @@ class PDFProcessingLogger:
                 "type": "replacement_success",
                 "original": original_text,
                 "result": result,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": time.perf_counter_ns()
             })
         else:
-            self.logger.debug(f"❌ No replacement needed for: {repr(original_text)}")
+            self.logger.debug("❌ No replacement needed for: %r", original_text)
     
     def log_fallback(self, from_mode: str, to_mode: str, reason: str):
         """Log mode fallback events."""
@@ -168,7 +192,7 @@ class PDFProcessingLogger:
             "from_mode": from_mode,
             "to_mode": to_mode,
             "reason": reason,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.perf_counter_ns()
         })
     
     def log_error(self, error: Exception, context: str):
@@ -179,7 +203,7 @@ class PDFProcessingLogger:
             "context": context,
             "error_type": type(error).__name__,
             "error_message": str(error),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.perf_counter_ns()
         })
     
     def log_output_pdf(self, pdf_bytes: bytes, filename: str = "output.pdf"):
@@ -202,22 +226,39 @@ class PDFProcessingLogger:
         self.logger.info(f"Font analysis for {font_path}: {available}/{total} characters available")
         for char, available in char_availability.items():
             status = "✅" if available else "❌"
-            self.logger.debug(f"  Character '{char}': {status}")
+            self.logger.debug("  Character '%s': %s", char, status)
+    
+    def flush(self):
+        """Write any buffered DEBUG records to the run's log file."""
+        self._buffered_handler.flush()
     
     def finalize_run(self):
         """Finalize the run and save metadata."""
-        self.run_metadata["end_time"] = datetime.now().isoformat()
+        end = datetime.now()
+        self.run_metadata["end_time"] = end
+        
+        # finalize_run may run more than once per logger; convert only raw readings
+        start = self.run_metadata["start_time"]
+        for record in (*self.run_metadata["steps"], *self.run_metadata["errors"]):
+            stamp = record["timestamp"]
+            if isinstance(stamp, int):
+                record["timestamp"] = start + timedelta(microseconds=(stamp - self._start_ns) // 1000)
         
         # Calculate duration
-        start = datetime.fromisoformat(self.run_metadata["start_time"])
-        end = datetime.fromisoformat(self.run_metadata["end_time"])
-        duration = (end - start).total_seconds()
+        duration = (end - self.run_metadata["start_time"]).total_seconds()
         self.run_metadata["duration_seconds"] = duration
         
-        # Save metadata
+        # Save metadata; timestamps are serialized as ISO 8601 strings
         metadata_file = self.run_dir / "run_metadata.json"
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(self.run_metadata, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            metadata_file.write_bytes(
+                orjson.dumps(self.run_metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+        else:
+            metadata_file.write_text(
+                json.dumps(self.run_metadata, indent=2, ensure_ascii=False, default=_json_default),
+                encoding='utf-8',
+            )
         
         self.logger.info(f"=== Run Complete: {self.run_id} (Duration: {duration:.2f}s) ===")
         self.logger.info(f"Run directory: {self.run_dir}")
@@ -231,6 +272,8 @@ class PDFProcessingLogger:
             self.logger.warning(f"Run completed with {errors_count} errors")
         else:
             self.logger.info(f"Run completed successfully with {mappings_count} mappings applied")
+        
+        self.flush()
 
 
 # Global logger instance
@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
+import heapq
 import io
+import os
 import re
-from collections import Counter, defaultdict
+from collections import defaultdict
+from collections.abc import Sized
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from operator import attrgetter, itemgetter
 from typing import Dict, Iterable, List, Optional, Pattern, Tuple
 
 import fitz  # PyMuPDF
@@ -13,7 +20,7 @@ from PyPDF2 import PdfReader, PdfWriter
 from PyPDF2.generic import ArrayObject, ContentStream, NameObject, NumberObject, TextStringObject
 
 from .logger import get_logger
-from .cross_array_processor import process_content_stream_with_cross_array_support
+from .cross_array_processor import CrossArrayProcessor
 
 try:  # Optional OCR dependencies
     import pytesseract
@@ -33,12 +40,20 @@ OCR_AVAILABLE: bool = pytesseract is not None and Image is not None
 
 WordRect = Tuple[float, float, float, float]
 
+_OVERLAY_DPI = 220
+_OVERLAY_MATRIX = fitz.Matrix(_OVERLAY_DPI / 72, _OVERLAY_DPI / 72)
+# Below this many pages, process start-up costs more than it saves
+_OVERLAY_PARALLEL_MIN_PAGES = 8
+# Short documents are not worth a pool; OCR workers also pin Tesseract to one
+# thread so a pool of cpu_count workers does not oversubscribe the machine
+_OCR_PARALLEL_MIN_PAGES = 8
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True)
 class OverlayTarget:
     page: int
     rect: WordRect
-    image: bytes
+    image: fitz.Pixmap
 
 
 @dataclasses.dataclass
@@ -89,17 +104,35 @@ def extract_text_preview(pdf_bytes: bytes, *, max_chars: int = 4000) -> str:
 def generate_word_occurrences(pdf_bytes: bytes) -> Dict[str, List[Dict[str, object]]]:
     """Collect rectangles for each distinct word in the PDF."""
 
+    index: Dict[str, List[Dict[str, object]]] = defaultdict(list)
+    for page_number, page_words in enumerate(_document_words(pdf_bytes)):
+        for rect, word in page_words:
+            token = word.strip()
+            if not token:
+                continue
+            index[token].append({"page": page_number, "rect": rect})
+    return index
+
+
+PageWords = Tuple[Tuple[WordRect, str], ...]
+
+
+def _document_words(pdf_bytes: bytes) -> Tuple[PageWords, ...]:
+    """Return every page's ``get_text("words")`` boxes.
+
+    Each request reads the boxes once (the word index when analyzing, overlay
+    capture when remapping). Nothing is cached across requests, so uploads are
+    not held in memory by the server process.
+    """
     doc = fitz.open(stream=pdf_bytes, filetype="pdf")
     try:
-        index: Dict[str, List[Dict[str, object]]] = defaultdict(list)
-        for page_number, page in enumerate(doc):
-            for x0, y0, x1, y1, word, *_ in page.get_text("words"):
-                token = word.strip()
-                if not token:
-                    continue
-                rect: WordRect = (float(x0), float(y0), float(x1), float(y1))
-                index[token].append({"page": page_number, "rect": rect})
-        return index
+        return tuple(
+            tuple(
+                ((float(x0), float(y0), float(x1), float(y1)), word)
+                for x0, y0, x1, y1, word, *_ in page.get_text("words")
+            )
+            for page in doc
+        )
     finally:
         doc.close()
 
@@ -107,25 +140,84 @@ def generate_word_occurrences(pdf_bytes: bytes) -> Dict[str, List[Dict[str, obje
 def summarise_vocabulary(word_index: Dict[str, Iterable[Dict[str, object]]], *, top_n: int = 50) -> List[Tuple[str, int]]:
     """Return the ``top_n`` most frequent words for quick UI suggestions."""
 
-    frequency = Counter({word: len(list(locations)) for word, locations in word_index.items()})
-    return frequency.most_common(top_n)
+    counts = (
+        (word, len(locations) if isinstance(locations, Sized) else sum(1 for _ in locations))
+        for word, locations in word_index.items()
+    )
+    # Same selection and tie order as Counter.most_common, without copying each location list
+    return heapq.nlargest(top_n, counts, key=itemgetter(1))
 
 
 def _build_pattern(words: Iterable[str], *, ignore_case: bool = False) -> Optional[Pattern[str]]:
     logger = get_logger()
     
-    ordered = [re.escape(word) for word in sorted(set(words), key=len, reverse=True)]
+    # Deterministic order so equal word sets share one cache entry
+    ordered = sorted(set(words), key=lambda word: (-len(word), word))
     if not ordered:
         logger.log_pattern_building([], "", ignore_case)
         return None
     
-    flags = re.IGNORECASE if ignore_case else 0
-    pattern = re.compile("|".join(ordered), flags)
+    pattern = _build_pattern_cached(tuple(ordered), ignore_case)
     
-    logger.log_pattern_building(list(words), pattern.pattern, ignore_case)
+    logger.log_pattern_building(ordered, pattern.pattern, ignore_case)
     return pattern
 
 
+@functools.lru_cache(maxsize=64)
+def _build_pattern_cached(words: Tuple[str, ...], ignore_case: bool) -> Pattern[str]:
+    """Compile the trie regex for ``words``; repeated mappings reuse the compiled pattern."""
+    flags = re.IGNORECASE if ignore_case else 0
+    return re.compile(_trie_alternation(words, ignore_case=ignore_case), flags)
+
+
+def clear_pattern_cache() -> None:
+    """Drop every memoized mapping regex held by the text and PyMuPDF pipelines."""
+    _build_pattern_cached.cache_clear()
+
+
+_TrieNode = Dict[str, Tuple[str, "_TrieNode"]]
+
+
+def _trie_alternation(words: Iterable[str], *, ignore_case: bool = False) -> str:
+    """Return a regex matching any of ``words``, structured as a prefix trie.
+
+    A flat ``a|b|c`` alternation makes ``re`` retry every word at every
+    position. Sharing prefixes leaves at most one viable branch per character,
+    and optional continuations are tried before stopping, so the longest word
+    still wins exactly as with a longest-first flat alternation.
+    """
+    root: _TrieNode = {}
+    for word in words:
+        node = root
+        for char in word:
+            folded = char.lower() if ignore_case else char
+            key = folded if len(folded) == 1 else char
+            node = node.setdefault(key, (char, {}))[1]
+        node[""] = ("", {})
+    return _trie_node_regex(root)
+
+
+def _trie_node_regex(node: _TrieNode) -> str:
+    branches: List[str] = []
+    for key, (char, child) in node.items():
+        if not key:
+            continue
+        # Collapse single-child chains so recursion only happens at branch points
+        chain = [re.escape(char)]
+        while len(child) == 1 and "" not in child:
+            ((char, child),) = child.values()
+            chain.append(re.escape(char))
+        branches.append("".join(chain) + _trie_node_regex(child))
+
+    if not branches:
+        return ""
+    if "" in node:
+        return "(?:" + "|".join(branches) + ")?"
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
 def _resolve_replacement(token: str, mapping: Dict[str, str], mapping_cf: Dict[str, str]) -> Optional[str]:
     replacement = mapping.get(token)
     if replacement is not None:
@@ -141,16 +233,12 @@ def _segment_text(
 ) -> Optional[List[Tuple[str, Optional[str]]]]:
     logger = get_logger()
     
-    matches = list(pattern.finditer(text))
-    if not matches:
-        logger.log_text_segment_analysis(text, None, "", "")
-        return None
-    
+    # Single pass over the matches; no intermediate match list
     segments: List[Tuple[str, Optional[str]]] = []
     last_idx = 0
-    found_replacements = []
+    replaced = False
     
-    for match in matches:
+    for match in pattern.finditer(text):
         start, end = match.span()
         if start > last_idx:
             segments.append((text[last_idx:start], None))
@@ -158,15 +246,20 @@ def _segment_text(
         replacement = _resolve_replacement(original, mapping, mapping_cf)
         segments.append((original, replacement))
         if replacement:
-            found_replacements.append(f"{original}→{replacement}")
+            replaced = True
         last_idx = end
+    
+    if not segments:
+        logger.log_text_segment_analysis(text, None, "", "")
+        return None
     if last_idx < len(text):
         segments.append((text[last_idx:], None))
     
-    # Log detailed analysis
-    if found_replacements:
+    # Log detailed analysis; the summary strings are only built when there is something to report
+    if replaced:
+        found_replacements = [f"{original}→{replacement}" for original, replacement in segments if replacement]
         logger.log_text_segment_analysis(text, segments, "", "")
-        logger.logger.info(f"Found {len(found_replacements)} replacements in text segment: {found_replacements}")
+        logger.logger.info("Found %d replacements in text segment: %s", len(found_replacements), found_replacements)
     
     return segments
 
@@ -179,30 +272,32 @@ def _rewrite_text(
 ) -> Optional[str]:
     logger = get_logger()
     
-    segments = _segment_text(text, pattern, mapping, mapping_cf)
-    if not segments:
+    def substitute(match: re.Match) -> str:
+        original = match.group(0)
+        replacement = _resolve_replacement(original, mapping, mapping_cf)
+        return original if replacement is None else replacement
+    
+    # Scan and substitute in one sre pass instead of building segment tuples
+    result, match_count = pattern.subn(substitute, text)
+    if not match_count:
         logger.log_replacement_attempt(text, pattern.pattern, mapping, None)
         return None
     
-    rebuilt: List[str] = []
-    for segment_text, replacement in segments:
-        if not segment_text:
-            continue
-        rebuilt.append(replacement if replacement is not None else segment_text)
-    
-    result = "".join(rebuilt)
     logger.log_replacement_attempt(text, pattern.pattern, mapping, result)
     return result
 
 
 def _array_to_text(array: ArrayObject) -> str:
+    # Parsed operands are exactly these PyPDF2 types (neither is subclassed), and exact
+    # type checks avoid the slow typing.Protocol isinstance() path.
     pieces: List[str] = []
+    append = pieces.append
     for item in array:
-        if isinstance(item, TextStringObject):
-            pieces.append(str(item))
-        elif isinstance(item, NumberObject):
-            if float(item) <= _SPACE_THRESHOLD:
-                pieces.append(" ")
+        item_type = type(item)
+        if item_type is TextStringObject:
+            append(str(item))
+        elif item_type is NumberObject and item <= _SPACE_THRESHOLD:
+            append(" ")
     return "".join(pieces)
 
 
@@ -214,32 +309,133 @@ def _collect_overlay_targets(
     if not mapping:
         return [], {}
 
+    words = _document_words(pdf_bytes)
+    # A token resolves only if its casefold equals a casefolded key, so pages whose
+    # casefolded text contains no key are skipped without a per-word lookup
+    folded_keys = {key.casefold() for key in mapping}
+    folded_keys.update(mapping_cf)
+    key_pattern = _build_pattern_cached(tuple(sorted(folded_keys, key=lambda key: (-len(key), key))), False)
+    page_numbers = [
+        page_number
+        for page_number, page_words in enumerate(words)
+        if key_pattern.search(" ".join(word for _, word in page_words).casefold())
+    ]
+    if not page_numbers:
+        return [], {}
+
+    workers = min(os.cpu_count() or 1, len(page_numbers))
+    per_page: Optional[List[Tuple[List[OverlayTarget], Dict[str, str]]]] = None
+    if len(page_numbers) < _OVERLAY_PARALLEL_MIN_PAGES or workers < 2:
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        try:
+            per_page = [
+                _page_overlay_targets(doc[page_number], page_number, words[page_number], mapping, mapping_cf)
+                for page_number in page_numbers
+            ]
+        finally:
+            doc.close()
+
+    if per_page is None:
+        # Rasterizing is CPU bound, so pages are spread over processes
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_overlay_worker,
+            initargs=(pdf_bytes, words, mapping, mapping_cf),
+        ) as pool:
+            per_page = [
+                (
+                    [
+                        OverlayTarget(page, rect, fitz.Pixmap(fitz.csRGB, width, height, samples, False))
+                        for page, rect, width, height, samples in raw_targets
+                    ],
+                    page_discovered,
+                )
+                for raw_targets, page_discovered in pool.map(_overlay_worker_page, page_numbers)
+            ]
+
     targets: List[OverlayTarget] = []
     discovered: Dict[str, str] = {}
+    for page_targets, page_discovered in per_page:
+        targets.extend(page_targets)
+        for token, replacement in page_discovered.items():
+            discovered.setdefault(token, replacement)
+    return targets, discovered
 
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    try:
-        for page_number, page in enumerate(doc):
-            for x0, y0, x1, y1, word, *_ in page.get_text("words"):
-                token = word.strip()
-                if not token:
-                    continue
-                replacement = _resolve_replacement(token, mapping, mapping_cf)
-                if replacement is None:
-                    continue
-                rect = (float(x0), float(y0), float(x1), float(y1))
-
-                # Capture the ORIGINAL text as it appears in the PDF - perfect size matching
-                pix = page.get_pixmap(clip=fitz.Rect(*rect), dpi=220, alpha=False)
-                original_image = pix.tobytes("png")
-                targets.append(OverlayTarget(page_number, rect, original_image))
-                discovered.setdefault(token, replacement)
-    finally:
-        doc.close()
+
+def _page_overlay_targets(
+    page: fitz.Page,
+    page_number: int,
+    page_words: PageWords,
+    mapping: Dict[str, str],
+    mapping_cf: Dict[str, str],
+) -> Tuple[List[OverlayTarget], Dict[str, str]]:
+    targets: List[OverlayTarget] = []
+    discovered: Dict[str, str] = {}
+
+    # Same lookup order as _resolve_replacement, but a token that is an exact or
+    # already case-folded key resolves in a single dict lookup
+    combined_get = {**mapping_cf, **mapping}.get
+    mapping_cf_get = mapping_cf.get
+
+    # Interpret the page once; each matched word only rasterizes its own clip
+    display_list = None
+    for rect, word in page_words:
+        token = word.strip()
+        if not token:
+            continue
+        replacement = combined_get(token)
+        if replacement is None:
+            folded = token.casefold()
+            if folded == token:
+                continue
+            replacement = mapping_cf_get(folded)
+            if replacement is None:
+                continue
+
+        # Capture the ORIGINAL text as it appears in the PDF - perfect size matching
+        if display_list is None:
+            display_list = page.get_displaylist()
+        # Kept as a pixmap: _apply_overlays inserts it directly, skipping a PNG encode/decode
+        pix = display_list.get_pixmap(matrix=_OVERLAY_MATRIX, clip=fitz.Rect(*rect), alpha=False)
+        targets.append(OverlayTarget(page_number, rect, pix))
+        discovered.setdefault(token, replacement)
 
     return targets, discovered
 
 
+# Per-process state for parallel overlay capture; each worker opens the document once
+_worker_doc: Optional[fitz.Document] = None
+_worker_words: Tuple[PageWords, ...] = ()
+_worker_mapping: Dict[str, str] = {}
+_worker_mapping_cf: Dict[str, str] = {}
+
+
+def _init_overlay_worker(
+    pdf_bytes: bytes,
+    words: Tuple[PageWords, ...],
+    mapping: Dict[str, str],
+    mapping_cf: Dict[str, str],
+) -> None:
+    global _worker_doc, _worker_words, _worker_mapping, _worker_mapping_cf
+    _worker_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    _worker_words = words
+    _worker_mapping = mapping
+    _worker_mapping_cf = mapping_cf
+
+
+def _overlay_worker_page(
+    page_number: int,
+) -> Tuple[List[Tuple[int, WordRect, int, int, bytes]], Dict[str, str]]:
+    targets, discovered = _page_overlay_targets(
+        _worker_doc[page_number], page_number, _worker_words[page_number], _worker_mapping, _worker_mapping_cf
+    )
+    # Pixmaps cannot be pickled; ship raw RGB samples back to the parent instead
+    raw_targets = [
+        (target.page, target.rect, target.image.width, target.image.height, target.image.samples)
+        for target in targets
+    ]
+    return raw_targets, discovered
+
 
 def _apply_overlays(pdf_bytes: bytes, overlays: List[OverlayTarget]) -> bytes:
     if not overlays:
@@ -247,14 +443,13 @@ def _apply_overlays(pdf_bytes: bytes, overlays: List[OverlayTarget]) -> bytes:
 
     doc = fitz.open(stream=pdf_bytes, filetype="pdf")
     try:
-        by_page: Dict[int, List[OverlayTarget]] = defaultdict(list)
-        for target in overlays:
-            by_page[target.page].append(target)
-        for page_number, items in by_page.items():
+        # Targets arrive in page order already; the stable sort keeps per-page order either way
+        page_of = attrgetter("page")
+        for page_number, items in groupby(sorted(overlays, key=page_of), key=page_of):
             page = doc[page_number]
             for target in items:
                 rect = fitz.Rect(*target.rect)
-                page.insert_image(rect, stream=target.image, keep_proportion=False, overlay=True)
+                page.insert_image(rect, pixmap=target.image, keep_proportion=False, overlay=True)
         output = io.BytesIO()
         doc.save(output, garbage=4, deflate=True)
         return output.getvalue()
@@ -285,6 +480,7 @@ def apply_word_mapping(pdf_bytes: bytes, mapping: Dict[str, str], mode: str = "o
     }
     if not clean_mapping:
         logger.logger.warning("No valid mappings provided after cleaning")
+        logger.finalize_run()
         return pdf_bytes
 
     logger.log_mappings(clean_mapping)
@@ -340,17 +536,21 @@ def apply_image_ocr_mapping(
         if not prepared:
             return pdf_bytes
 
-        for page in doc:
-            pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
-            image = Image.open(io.BytesIO(pix.tobytes("png"))).convert("RGB")
-            words = _extract_ocr_words(image, page.rect, scale, min_confidence)
-            if not words:
-                continue
-
-            matches = _match_ocr_words(words, prepared)
-            if not matches:
-                continue
-
+        page_count = doc.page_count
+        workers = min(os.cpu_count() or 1, page_count)
+        if page_count < _OCR_PARALLEL_MIN_PAGES or workers < 2:
+            per_page = [_ocr_page_matches(page, prepared, scale, min_confidence) for page in doc]
+        else:
+            # Tesseract dominates and is CPU bound; pages are recognised in worker processes
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_ocr_worker,
+                initargs=(pdf_bytes, prepared, scale, min_confidence),
+            ) as pool:
+                per_page = list(pool.map(_ocr_worker_page, range(page_count)))
+
+        # Document edits stay in this process
+        for page, matches in zip(doc, per_page):
             for match in matches:
                 page.insert_textbox(
                     match.rect,
@@ -373,13 +573,56 @@ def apply_image_ocr_mapping(
         doc.close()
 
 
+def _ocr_page_matches(
+    page: fitz.Page,
+    prepared: List[Tuple[List[str], str]],
+    scale: float,
+    min_confidence: int,
+) -> List[OCRMatch]:
+    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), colorspace=fitz.csRGB, alpha=False)
+    # Hand the raw RGB samples to PIL directly instead of a PNG encode/decode round-trip
+    image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    words = _extract_ocr_words(image, page.rect, scale, min_confidence)
+    if not words:
+        return []
+    return _match_ocr_words(words, prepared)
+
+
+# Per-process state for parallel OCR; each worker opens the document once
+_worker_ocr_doc: Optional[fitz.Document] = None
+_worker_ocr_options: Tuple[List[Tuple[List[str], str]], float, int] = ([], 1.0, 0)
+
+
+def _init_ocr_worker(
+    pdf_bytes: bytes,
+    prepared: List[Tuple[List[str], str]],
+    scale: float,
+    min_confidence: int,
+) -> None:
+    global _worker_ocr_doc, _worker_ocr_options
+    # Tesseract's OpenMP threads would otherwise compete with the other workers
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    _worker_ocr_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    _worker_ocr_options = (prepared, scale, min_confidence)
+
+
+def _ocr_worker_page(page_number: int) -> List[OCRMatch]:
+    prepared, scale, min_confidence = _worker_ocr_options
+    return _ocr_page_matches(_worker_ocr_doc[page_number], prepared, scale, min_confidence)
+
+
 def _ensure_ocr_dependencies() -> None:
     if not OCR_AVAILABLE:
         raise RuntimeError("pytesseract and Pillow are required for OCR-based mapping")
 
 
+# ASCII bytes other than [0-9A-Za-z]; OCR tokens keep only ASCII letters and digits
+_OCR_DROP_BYTES = bytes(code for code in range(128) if not chr(code).isalnum())
+
+
 def _normalize_ocr_token(token: str) -> str:
-    return re.sub(r"[^0-9A-Za-z]+", "", token).casefold()
+    # Same result as re.sub(r"[^0-9A-Za-z]+", "", token).casefold(), via C-level byte filtering
+    return token.encode("ascii", "ignore").translate(None, _OCR_DROP_BYTES).decode("ascii").lower()
 
 
 def _tokenize_mapping_key(key: str) -> List[str]:
@@ -448,38 +691,41 @@ def _extract_ocr_words(image: "Image.Image", page_rect: fitz.Rect, scale: float,
 
 def _match_ocr_words(words: List[OCRWord], prepared: List[Tuple[List[str], str]]) -> List[OCRMatch]:
     matches: List[OCRMatch] = []
-    used: Set[int] = set()
+    # Bit ``i`` is set once word ``i`` belongs to a match; a window test is one AND
+    used = 0
     norms = [word.norm for word in words]
+    # Parallel coordinate columns so a span's union and height are slice reductions
+    x0s = [word.rect.x0 for word in words]
+    y0s = [word.rect.y0 for word in words]
+    x1s = [word.rect.x1 for word in words]
+    y1s = [word.rect.y1 for word in words]
+    heights = [word.height for word in words]
+    # Only positions whose word equals a key's first token can start a match
+    starts: Dict[str, List[int]] = defaultdict(list)
+    for idx, norm in enumerate(norms):
+        starts[norm].append(idx)
     for tokens, replacement in prepared:
         span = len(tokens)
         if span == 0 or span > len(words):
             continue
-        i = 0
-        while i <= len(words) - span:
-            if any(idx in used for idx in range(i, i + span)):
-                i += 1
+        last_start = len(words) - span
+        window = (1 << span) - 1
+        for i in starts.get(tokens[0], ()):
+            if i > last_start:
+                break
+            if used & (window << i):
                 continue
-            window = norms[i : i + span]
-            if window == tokens:
-                rects = [words[i + offset].rect for offset in range(span)]
-                union = fitz.Rect(
-                    min(r.x0 for r in rects),
-                    min(r.y0 for r in rects),
-                    max(r.x1 for r in rects),
-                    max(r.y1 for r in rects),
-                )
+            end = i + span
+            if norms[i:end] == tokens:
                 union = fitz.Rect(
-                    union.x0 - 0.8,
-                    union.y0 - 0.8,
-                    union.x1 + 0.8,
-                    union.y1 + 0.8,
+                    min(x0s[i:end]) - 0.8,
+                    min(y0s[i:end]) - 0.8,
+                    max(x1s[i:end]) + 0.8,
+                    max(y1s[i:end]) + 0.8,
                 )
-                font_size = max(8.0, sum(words[i + offset].height for offset in range(span)) / span)
+                font_size = max(8.0, sum(heights[i:end]) / span)
                 matches.append(OCRMatch(rect=union, replacement=replacement, font_size=font_size))
-                used.update(range(i, i + span))
-                i += span
-            else:
-                i += 1
+                used |= window << i
     return matches
 
 
@@ -499,7 +745,9 @@ def _apply_overlay_mode_mapping(
     if overlays:
         logger.logger.info("Captured %d overlay targets", len(overlays))
 
-    rewritten = _apply_content_stream_mapping(pdf_bytes, clean_mapping)
+    rewritten = _apply_content_stream_mapping(
+        pdf_bytes, clean_mapping, expanded_mapping=overlay_mapping, mapping_cf=mapping_cf
+    )
     if rewritten is not None:
         logger.logger.info("Content stream rewrite succeeded")
         processed = _sanitize_text_layer(rewritten) if sanitize else rewritten
@@ -531,20 +779,36 @@ def _expand_mapping_variants(clean_mapping: Dict[str, str]) -> Dict[str, str]:
     return expanded
 
 
-def _apply_content_stream_mapping(pdf_bytes: bytes, clean_mapping: Dict[str, str]) -> Optional[bytes]:
-    """Attempt in-place text replacement using PyPDF2 content stream rewriting."""
+def _apply_content_stream_mapping(
+    pdf_bytes: bytes,
+    clean_mapping: Dict[str, str],
+    *,
+    expanded_mapping: Optional[Dict[str, str]] = None,
+    mapping_cf: Optional[Dict[str, str]] = None,
+) -> Optional[bytes]:
+    """Attempt in-place text replacement using PyPDF2 content stream rewriting.
+
+    Callers that already expanded ``clean_mapping`` (and its casefolded lookup)
+    can pass them in to avoid rebuilding both.
+    """
     if not clean_mapping:
         return None
 
     logger = get_logger()
-    reader = PdfReader(io.BytesIO(pdf_bytes))
 
-    effective_mapping = _expand_mapping_variants(clean_mapping)
+    effective_mapping = expanded_mapping
+    if effective_mapping is None:
+        effective_mapping = _expand_mapping_variants(clean_mapping)
     pattern = _build_pattern(effective_mapping.keys(), ignore_case=True)
     if pattern is None:
         return None
 
-    mapping_cf = {key.casefold(): value for key, value in effective_mapping.items()}
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+
+    if mapping_cf is None:
+        mapping_cf = {key.casefold(): value for key, value in effective_mapping.items()}
+    # One processor serves every page; its lookup tables depend only on the mapping
+    processor = CrossArrayProcessor(pattern, effective_mapping, mapping_cf)
 
     any_modified = False
     for page_number, page in enumerate(reader.pages):
@@ -552,12 +816,7 @@ def _apply_content_stream_mapping(pdf_bytes: bytes, clean_mapping: Dict[str, str
             continue
 
         content = ContentStream(page[NameObject("/Contents")].get_object(), reader)
-        modified_ops, page_modified = process_content_stream_with_cross_array_support(
-            content.operations,
-            pattern,
-            effective_mapping,
-            mapping_cf,
-        )
+        modified_ops, page_modified = processor.process_content_operations(content.operations)
 
         if not page_modified:
             continue
@@ -592,42 +851,35 @@ def _sanitize_text_layer(pdf_bytes: bytes) -> bytes:
             continue
 
         content = ContentStream(page[NameObject("/Contents")].get_object(), reader)
-        new_operations = []
-        page_modified = False
-
-        for operands, operator in content.operations:
+        operations = content.operations
+        # Copy-on-write: the output list is only built once an operation changes
+        new_operations: Optional[List[Tuple]] = None
+
+        for index, operation in enumerate(operations):
+            operands, operator = operation
+            changed = False
+            replacement_op = None
             if operator == b"Tj" and operands:
-                text_obj = operands[0]
-                if isinstance(text_obj, TextStringObject):
-                    raw_bytes = getattr(text_obj, "original_bytes", b"")
-                    if raw_bytes and set(raw_bytes) <= {0}:
-                        page_modified = True
-                        continue  # Drop null-only text object
+                changed = _is_null_text(operands[0])  # Drop null-only text object
             elif operator == b"TJ" and operands:
                 array_obj = operands[0]
-                if isinstance(array_obj, ArrayObject):
-                    sanitized_array = ArrayObject()
-                    array_modified = False
-                    for item in array_obj:
-                        if isinstance(item, TextStringObject):
-                            raw_bytes = getattr(item, "original_bytes", b"")
-                            if raw_bytes and set(raw_bytes) <= {0}:
-                                array_modified = True
-                                continue
-                        sanitized_array.append(item)
+                if isinstance(array_obj, ArrayObject) and (
+                    not array_obj or any(_is_null_text(item) for item in array_obj)
+                ):
+                    changed = True
+                    sanitized_array = ArrayObject(item for item in array_obj if not _is_null_text(item))
                     if sanitized_array:
-                        if array_modified:
-                            page_modified = True
-                            new_operations.append(([sanitized_array], operator))
-                        else:
-                            new_operations.append((operands, operator))
-                        continue
-                    page_modified = True
-                    continue
-
-            new_operations.append((operands, operator))
-
-        if page_modified:
+                        replacement_op = ([sanitized_array], operator)
+
+            if changed:
+                if new_operations is None:
+                    new_operations = operations[:index]
+                if replacement_op is not None:
+                    new_operations.append(replacement_op)
+            elif new_operations is not None:
+                new_operations.append(operation)
+
+        if new_operations is not None:
             modified = True
             sanitized_stream = ContentStream(None, reader)
             sanitized_stream.operations = new_operations
@@ -645,6 +897,15 @@ def _sanitize_text_layer(pdf_bytes: bytes) -> bytes:
     return output.getvalue()
 
 
+def _is_null_text(item: object) -> bool:
+    """Return True for a text string whose raw bytes are all NUL glyph placeholders."""
+    # The str check screens non-strings before the slower PyPDF2 isinstance
+    if not isinstance(item, str) or not isinstance(item, TextStringObject):
+        return False
+    raw_bytes = getattr(item, "original_bytes", b"")
+    return bool(raw_bytes) and not raw_bytes.strip(b"\x00")
+
+
 def _apply_font_mode_mapping(pdf_bytes: bytes, clean_mapping: Dict[str, str]) -> bytes:
     """Apply word mapping using the malicious T-font pipeline with overlay fallback."""
     logger = get_logger()
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from itertools import groupby
+from operator import itemgetter
 from typing import Dict, List, Optional, Pattern, Tuple
 
 import io
@@ -11,6 +13,7 @@ import fitz  # PyMuPDF
 from PIL import Image
 
 from .logger import get_logger
+from .pdf_processor import _build_pattern_cached
 
 
 class PyMuPDFProcessor:
@@ -20,6 +23,8 @@ class PyMuPDFProcessor:
         self.pattern = pattern
         self.clean_mapping = clean_mapping
         self.mapping_cf = mapping_cf
+        # Exact keys win over case-folded ones; one lookup covers both for most matches
+        self._combined = {**mapping_cf, **clean_mapping}
         self.logger = get_logger()
         self._font_cache: Dict[str, Tuple[str, Optional[bytes]]] = {}
 
@@ -91,10 +96,9 @@ class PyMuPDFProcessor:
                 continue  # Skip image blocks
 
             for line in block["lines"]:
-                spans = []
+                # Rewrite text first; geometry is only needed for lines that change
+                span_texts = []
                 line_changed = False
-                line_bbox = list(line.get("bbox", (float("inf"), float("inf"), float("-inf"), float("-inf"))))
-
                 for span in line["spans"]:
                     chars = span.get("chars", [])
                     if not chars:
@@ -102,11 +106,22 @@ class PyMuPDFProcessor:
 
                     text = "".join(char["c"] for char in chars)
                     new_text = self._apply_text_replacements(text)
+                    span_texts.append((span, chars, text, new_text))
+                    if new_text != text:
+                        line_changed = True
 
-                    span_x0 = min(char["bbox"][0] for char in chars)
-                    span_y0 = min(char["bbox"][1] for char in chars)
-                    span_x1 = max(char["bbox"][2] for char in chars)
-                    span_y1 = max(char["bbox"][3] for char in chars)
+                if not line_changed:
+                    continue
+
+                spans = []
+                line_bbox = list(line.get("bbox", (float("inf"), float("inf"), float("-inf"), float("-inf"))))
+                for span, chars, text, new_text in span_texts:
+                    # Transpose the char boxes once so each edge is a single C-level min/max
+                    x0s, y0s, x1s, y1s = zip(*(char["bbox"] for char in chars))
+                    span_x0 = min(x0s)
+                    span_y0 = min(y0s)
+                    span_x1 = max(x1s)
+                    span_y1 = max(y1s)
 
                     if line_bbox[0] == float("inf"):
                         line_bbox = [span_x0, span_y0, span_x1, span_y1]
@@ -127,12 +142,6 @@ class PyMuPDFProcessor:
                         "bbox": (span_x0, span_y0, span_x1, span_y1),
                     })
 
-                    if new_text != text:
-                        line_changed = True
-
-                if not spans or not line_changed:
-                    continue
-
                 bbox_tuple = self._expand_bbox(tuple(line_bbox), page.rect)
                 overlays.append({
                     "page": page_num,
@@ -180,82 +189,98 @@ class PyMuPDFProcessor:
                             }
                         })
 
-        # Apply replacements
+        # Mark every original span first; apply_redactions re-parses the page, so run it once
+        pending = []
         for instance in text_instances:
             new_text = self._apply_text_replacements(instance["text"])
             if new_text != instance["text"]:
-                # Remove original text
                 page.add_redact_annot(instance["bbox"])
-                page.apply_redactions()
-
-                # Add new text using the original font when available.
-                font_alias = self._ensure_font(page.parent, page, instance["font_info"].get("font", ""))
-                page.insert_text(
-                    instance["bbox"][:2],  # (x, y) - top-left corner
-                    new_text,
-                    fontsize=instance["font_info"].get("size", 12),
-                    fontname=font_alias,
-                    color=self._color_to_rgb(instance["font_info"].get("color", 0)),
-                )
+                pending.append((instance, new_text))
+
+        if not pending:
+            return 0
+        page.apply_redactions()
+
+        for instance, new_text in pending:
+            # Add new text using the original font when available.
+            font_alias = self._ensure_font(page.parent, page, instance["font_info"].get("font", ""))
+            page.insert_text(
+                instance["bbox"][:2],  # (x, y) - top-left corner
+                new_text,
+                fontsize=instance["font_info"].get("size", 12),
+                fontname=font_alias,
+                color=self._color_to_rgb(instance["font_info"].get("color", 0)),
+            )
 
-                replacements_made += 1
-                self.logger.logger.info(
-                    f"Page {page_num + 1}: Direct replacement '{instance['text']}' → '{new_text}'"
-                )
+            replacements_made += 1
+            self.logger.logger.info(
+                f"Page {page_num + 1}: Direct replacement '{instance['text']}' → '{new_text}'"
+            )
 
         return replacements_made
 
     def _apply_text_replacements(self, text: str) -> str:
         """Apply regex-based text replacements."""
+        combined_get = self._combined.get
+        mapping_cf_get = self.mapping_cf.get
+        debug = self.logger.logger.debug
+
         def replace_func(match):
             matched_text = match.group()
             # Try case-sensitive first, then case-insensitive
-            if matched_text in self.clean_mapping:
-                replacement = self.clean_mapping[matched_text]
-            else:
-                replacement = self.mapping_cf.get(matched_text.casefold(), matched_text)
+            replacement = combined_get(matched_text)
+            if replacement is None:
+                replacement = mapping_cf_get(matched_text.casefold(), matched_text)
 
-            self.logger.logger.debug(f"Replacing '{matched_text}' with '{replacement}'")
+            debug("Replacing '%s' with '%s'", matched_text, replacement)
             return replacement
 
         return self.pattern.sub(replace_func, text)
 
     def _apply_overlays_pymupdf(self, doc: fitz.Document, overlays: List[Dict]) -> bytes:
         """Apply overlays to preserve original text appearance."""
-        for overlay in overlays:
+        for page_num, page_overlays in groupby(sorted(overlays, key=itemgetter("page")), key=itemgetter("page")):
+            page_overlays = list(page_overlays)
             try:
-                page = doc[overlay["page"]]
-                bbox = overlay["bbox"]
-
-                clip_rect = fitz.Rect(*bbox)
-
-                # Remove the original glyphs within this region before redrawing.
-                page.add_redact_annot(clip_rect, fill=(1, 1, 1))
+                page = doc[page_num]
+                # Remove the original glyphs of every region before redrawing; one
+                # apply_redactions per page instead of one per overlay.
+                for overlay in page_overlays:
+                    page.add_redact_annot(fitz.Rect(*overlay["bbox"]), fill=(1, 1, 1))
                 page.apply_redactions()
-
-                for span_info in overlay["spans"]:
-                    baseline = span_info.get("origin")
-                    if not baseline or len(baseline) != 2:
-                        bbox_span = span_info.get("bbox", bbox)
-                        baseline = (bbox_span[0], bbox_span[1] + span_info["size"])
-
-                    font_alias = self._ensure_font(doc, page, span_info.get("font", ""))
-                    page.insert_text(
-                        baseline,
-                        span_info["new_text"],
-                        fontsize=span_info["size"],
-                        fontname=font_alias,
-                        color=self._color_to_rgb(span_info.get("color", 0)),
-                    )
-
-                self.logger.logger.debug(f"Redrew overlay spans on page {overlay['page'] + 1}")
-
             except Exception as e:
-                self.logger.log_error(e, f"apply_overlay_page_{overlay['page']}")
+                self.logger.log_error(e, f"apply_overlay_page_{page_num}")
                 continue
 
+            for overlay in page_overlays:
+                try:
+                    self._redraw_overlay_spans(doc, page, overlay)
+                except Exception as e:
+                    self.logger.log_error(e, f"apply_overlay_page_{overlay['page']}")
+                    continue
+
         return doc.tobytes()
 
+    def _redraw_overlay_spans(self, doc: fitz.Document, page: fitz.Page, overlay: Dict) -> None:
+        """Insert the replacement text for one overlay whose region was already redacted."""
+        bbox = overlay["bbox"]
+        for span_info in overlay["spans"]:
+            baseline = span_info.get("origin")
+            if not baseline or len(baseline) != 2:
+                bbox_span = span_info.get("bbox", bbox)
+                baseline = (bbox_span[0], bbox_span[1] + span_info["size"])
+
+            font_alias = self._ensure_font(doc, page, span_info.get("font", ""))
+            page.insert_text(
+                baseline,
+                span_info["new_text"],
+                fontsize=span_info["size"],
+                fontname=font_alias,
+                color=self._color_to_rgb(span_info.get("color", 0)),
+            )
+
+        self.logger.logger.debug(f"Redrew overlay spans on page {overlay['page'] + 1}")
+
     def _color_to_rgb(self, value: int) -> Tuple[float, float, float]:
         """Convert an integer PDF color to an RGB triple for PyMuPDF."""
         if value is None:
@@ -347,10 +372,9 @@ def process_pdf_with_pymupdf(pdf_bytes: bytes, clean_mapping: Dict[str, str], mo
         logger.logger.warning("No mappings provided")
         return pdf_bytes
 
-    # Build regex pattern
-    words = sorted(clean_mapping.keys(), key=len, reverse=True)
-    escaped_words = [re.escape(word) for word in words]
-    pattern = re.compile('|'.join(escaped_words), re.IGNORECASE)
+    # Build regex pattern; the prefix trie keeps scans cheap as the key count grows,
+    # and the ordering matches _build_pattern so both pipelines share a cache entry
+    pattern = _build_pattern_cached(tuple(sorted(clean_mapping, key=lambda word: (-len(word), word))), True)
 
     # Create case-folded mapping for case-insensitive matching
     mapping_cf = {key.casefold(): value for key, value in clean_mapping.items()}
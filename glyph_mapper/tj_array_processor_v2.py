@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import string
 from typing import Dict, List, Optional, Pattern, Tuple, Union
 
 from PyPDF2.generic import ArrayObject, NumberObject, TextStringObject
@@ -12,6 +14,66 @@ from .logger import get_logger
 
 _SPACE_THRESHOLD = -120  # Matches threshold used for treating kerning as spaces.
 
+_SPECIAL_CHAR_REPLACEMENTS = {
+    '\x0c': 'fi',  # Form feed → 'fi' ligature
+    '\x0b': 'fl',  # Vertical tab → 'fl' ligature
+    '\x0e': 'ff',  # Shift out → 'ff' ligature
+    '\x0f': 'ffi', # Shift in → 'ffi' ligature
+    '\r': '',      # Carriage return → remove
+    '\x1f': '',    # Unit separator → remove
+}
+
+
+_PRINTABLE = frozenset(string.printable)
+
+# One translate table covering the ASCII range: ligature codes expand,
+# remaining control characters are dropped, printable characters pass through.
+_ASCII_CLEAN_TABLE = {
+    code: _SPECIAL_CHAR_REPLACEMENTS.get(chr(code))
+    for code in range(128)
+    if chr(code) in _SPECIAL_CHAR_REPLACEMENTS or chr(code) not in _PRINTABLE
+}
+
+
+@functools.lru_cache(maxsize=8192)
+def _clean_special_chars(text: str) -> str:
+    """Clean special characters, converting ligature codes to text.
+
+    TJ fragments repeat heavily across a document, so results are memoised.
+    """
+    cleaned = text.translate(_ASCII_CLEAN_TABLE)
+    
+    # Remove remaining non-printable characters
+    if not cleaned.isascii():
+        cleaned = ''.join(c for c in cleaned if c in _PRINTABLE)
+    
+    return cleaned
+
+
+def _decode_text_item(item: TextStringObject) -> str:
+    """Decode a TJ/Tj string operand the way the V2 processor sees it."""
+    # Properly decode PDF text string - PyPDF2 TextStringObject has proper decoding
+    try:
+        # Try to get the properly decoded text from PyPDF2
+        if hasattr(item, 'get_data'):
+            raw_text = item.get_data().decode('utf-8', errors='replace')
+        elif hasattr(item, 'original_bytes'):
+            raw_text = item.original_bytes.decode('utf-8', errors='replace')
+        else:
+            # Fallback to string conversion, but handle encoding properly
+            raw_text = str(item)
+            # If it looks like encoded bytes, try to decode
+            if all(ord(c) < 256 for c in raw_text):
+                try:
+                    # Try Latin-1 decoding which maps bytes 1:1 to Unicode
+                    raw_text = raw_text.encode('latin-1').decode('utf-8', errors='replace')
+                except:
+                    pass
+    except Exception:
+        # Ultimate fallback
+        raw_text = str(item)
+    return raw_text
+
 
 class TJArrayProcessorV2:
     """TJ array processor that keeps word ownership aligned to original segments."""
@@ -36,27 +98,7 @@ class TJArrayProcessorV2:
 
         for array_index, item in enumerate(array_obj):
             if isinstance(item, TextStringObject):
-                # Properly decode PDF text string - PyPDF2 TextStringObject has proper decoding
-                try:
-                    # Try to get the properly decoded text from PyPDF2
-                    if hasattr(item, 'get_data'):
-                        raw_text = item.get_data().decode('utf-8', errors='replace')
-                    elif hasattr(item, 'original_bytes'):
-                        raw_text = item.original_bytes.decode('utf-8', errors='replace')
-                    else:
-                        # Fallback to string conversion, but handle encoding properly
-                        raw_text = str(item)
-                        # If it looks like encoded bytes, try to decode
-                        if all(ord(c) < 256 for c in raw_text):
-                            try:
-                                # Try Latin-1 decoding which maps bytes 1:1 to Unicode
-                                raw_text = raw_text.encode('latin-1').decode('utf-8', errors='replace')
-                            except:
-                                pass
-                except Exception:
-                    # Ultimate fallback
-                    raw_text = str(item)
-
+                raw_text = _decode_text_item(item)
                 cleaned_text = self._clean_special_chars(raw_text)
 
                 segment_index = len(text_segments)
@@ -174,24 +216,7 @@ class TJArrayProcessorV2:
     
     def _clean_special_chars(self, text: str) -> str:
         """Clean special characters, converting ligature codes to text."""
-        char_replacements = {
-            '\x0c': 'fi',  # Form feed → 'fi' ligature
-            '\x0b': 'fl',  # Vertical tab → 'fl' ligature
-            '\x0e': 'ff',  # Shift out → 'ff' ligature
-            '\x0f': 'ffi', # Shift in → 'ffi' ligature
-            '\r': '',      # Carriage return → remove
-            '\x1f': '',    # Unit separator → remove
-        }
-        
-        cleaned = text
-        for char, replacement in char_replacements.items():
-            cleaned = cleaned.replace(char, replacement)
-        
-        # Remove remaining non-printable characters
-        import string
-        cleaned = ''.join(c for c in cleaned if c in string.printable or c == '\n')
-        
-        return cleaned
+        return _clean_special_chars(str(text))
     
     def _apply_replacements(
         self, text: str
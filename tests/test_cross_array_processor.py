@@ -0,0 +1,169 @@
+"""Unit tests for cross-array pattern matching on TJ operations."""
+
+from __future__ import annotations
+
+import re
+from types import SimpleNamespace
+
+import pytest
+from PyPDF2.generic import ArrayObject, NumberObject, TextStringObject
+
+import glyph_mapper.cross_array_processor as cross_array_processor
+import glyph_mapper.tj_array_processor_v2 as tj_array_processor_v2
+from glyph_mapper.cross_array_processor import CrossArrayProcessor
+
+
+class DummyLogger:
+    """Minimal stand-in for ``PDFProcessingLogger`` during unit tests."""
+
+    def __init__(self) -> None:
+        noop = lambda *args, **kwargs: None
+        self.logger = SimpleNamespace(debug=noop, info=noop, warning=noop, error=noop)
+
+    def log_error(self, error: Exception, context: str) -> None:
+        self.logger.error(error, context)
+
+
+@pytest.fixture(autouse=True)
+def _dummy_logger(monkeypatch) -> None:
+    dummy_logger = DummyLogger()
+    monkeypatch.setattr(cross_array_processor, "get_logger", lambda: dummy_logger)
+    monkeypatch.setattr(tj_array_processor_v2, "get_logger", lambda: dummy_logger)
+
+
+def _tj(*items) -> ArrayObject:
+    return ArrayObject(
+        NumberObject(item) if isinstance(item, int) else TextStringObject(item) for item in items
+    )
+
+
+def _find_matches(processor, tj_operations):
+    array_texts = [processor._extract_array_text(array_obj) for _, array_obj in tj_operations]
+    return processor._find_cross_array_matches(tj_operations, array_texts)
+
+
+def _make_processor(mapping):
+    ordered = sorted(mapping, key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(key) for key in ordered), re.IGNORECASE)
+    mapping_cf = {key.casefold(): value for key, value in mapping.items()}
+    return CrossArrayProcessor(pattern, mapping, mapping_cf)
+
+
+@pytest.mark.parametrize(
+    "window_text",
+    ["= 0 : 9: rest", "= 0 9: rest", "= 09: rest"],
+)
+def test_split_decimal_variants_reported_once(window_text) -> None:
+    processor = _make_processor({"0.9:": "9.0:"})
+
+    matches = processor._find_split_decimal_patterns(window_text, [])
+
+    assert [match["text"] for match in matches] == ["0.9:"]
+    assert matches[0]["span"][0] == 0
+
+
+def test_split_decimal_ignores_unmapped_numbers() -> None:
+    processor = _make_processor({"0.9:": "9.0:"})
+
+    assert processor._find_split_decimal_patterns("= 1 2:", []) == []
+
+
+def test_cross_array_match_reported_once_with_spanned_arrays() -> None:
+    processor = _make_processor({"0.9:": "9.0:"})
+    tj_operations = [
+        (0, _tj("k")),
+        (2, _tj(-278, "=", -278, "0")),
+        (4, _tj(1, ":")),
+        (6, _tj("9:", -436, "Will")),
+    ]
+
+    matches = _find_matches(processor, tj_operations)
+
+    assert len(matches) == 1
+    assert matches[0]["original"] == "0.9:"
+    assert [index for index, _ in matches[0]["window_operations"]] == [2, 4, 6]
+
+
+def test_single_array_matches_left_to_v2_processor() -> None:
+    processor = _make_processor({"dog": "cat"})
+    tj_operations = [(0, _tj("a dog")), (1, _tj("barks"))]
+
+    assert _find_matches(processor, tj_operations) == []
+
+
+def test_array_prefilter_is_case_insensitive() -> None:
+    processor = _make_processor({"dog": "cat"})
+
+    assert processor._array_may_match(_tj("Big ", -300, "DOGS"))
+    assert not processor._array_may_match(_tj("owls", -300, "bark"))
+    assert not processor._array_may_match(_tj("drab", -300, "day"))
+
+
+def test_array_prefilter_sees_kerning_spaces() -> None:
+    processor = _make_processor({"big dog": "cat"})
+
+    assert processor._array_may_match(_tj("big", -300, "dog"))
+    assert not processor._array_may_match(_tj("big", -20, "dog"))
+
+
+def test_cross_array_decimal_replacement_patches_only_matched_operations() -> None:
+    processor = _make_processor({"0.9:": "9.0:"})
+    untouched = ([_tj("k")], b"TJ")
+    operations = [
+        untouched,
+        ([_tj("=", -278, "0")], b"TJ"),
+        ([_tj("9:", -436, "Will")], b"TJ"),
+    ]
+
+    result, modified = processor._apply_cross_array_processing(operations)
+
+    assert modified is True
+    assert result[0] is untouched
+    assert [str(item) for item in result[1][0][0]] == ["=", "-278", "9"]
+    assert [str(item) for item in result[2][0][0]] == [".0:", "-436", "Will"]
+
+
+def test_tj_pattern_replacement_keeps_unmapped_text() -> None:
+    processor = _make_processor({"dog": "cat", "Dogs": "owls"})
+
+    assert processor._apply_pattern_replacement("Dogs and a DOG.") == "owls and a cat."
+
+
+def test_split_decimal_scan_skipped_without_decimal_keys() -> None:
+    processor = _make_processor({"dog": "cat"})
+
+    assert processor._has_decimal_keys is False
+    assert processor._find_split_decimal_patterns("= 0 : 9: rest", []) == []
+
+
+def test_cross_array_word_match_found_without_decimal_keys() -> None:
+    processor = _make_processor({"big dog": "cat"})
+    tj_operations = [(0, _tj("a big")), (1, _tj("dog barks"))]
+
+    matches = _find_matches(processor, tj_operations)
+
+    assert [match["original"] for match in matches] == ["big dog"]
+
+
+def test_v2_pass_returns_operations_unchanged_without_matches() -> None:
+    processor = _make_processor({"dog": "cat"})
+    operations = [([_tj("a bird")], b"TJ"), ([TextStringObject("no match")], b"Tj"), ([], b"ET")]
+
+    result, modified = processor._apply_v2_processor(operations)
+
+    assert modified is False
+    assert result is operations
+
+
+def test_v2_pass_copies_operations_from_first_rewrite() -> None:
+    processor = _make_processor({"dog": "cat"})
+    leading = ([], b"BT")
+    trailing = ([TextStringObject("no match")], b"Tj")
+    operations = [leading, ([TextStringObject("a dog")], b"Tj"), trailing]
+
+    result, modified = processor._apply_v2_processor(operations)
+
+    assert modified is True
+    assert result[0] is leading and result[2] is trailing
+    assert str(result[1][0][0]) == "a cat"
+    assert str(operations[1][0][0]) == "a dog"
@@ -0,0 +1,173 @@
+"""Unit tests for PDF font inspection helpers."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import fitz
+import pytest
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+
+import glyph_mapper.font_manipulator as font_manipulator
+
+
+class DummyLogger:
+    """Minimal stand-in for ``PDFProcessingLogger`` during unit tests."""
+
+    def __init__(self) -> None:
+        noop = lambda *args, **kwargs: None
+        self.logger = SimpleNamespace(debug=noop, info=noop, warning=noop, error=noop)
+
+    def log_error(self, error: Exception, context: str) -> None:
+        raise error
+
+
+@pytest.fixture(autouse=True)
+def _dummy_logger(monkeypatch) -> None:
+    dummy_logger = DummyLogger()
+    monkeypatch.setattr(font_manipulator, "get_logger", lambda: dummy_logger)
+
+
+def _write_font(path, *, platform_ids=(0, 3)) -> str:
+    glyph_order = [".notdef", "a", "b"]
+    pen = TTGlyphPen(None)
+    pen.moveTo((0, 0))
+    pen.lineTo((0, 500))
+    pen.lineTo((500, 0))
+    pen.closePath()
+    glyph = pen.glyph()
+
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(glyph_order)
+    builder.setupCharacterMap({ord("a"): "a", ord("b"): "b"})
+    builder.setupGlyf({name: glyph for name in glyph_order})
+    builder.setupHorizontalMetrics({name: (500, 0) for name in glyph_order})
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable({"familyName": "Test", "styleName": "Regular"})
+    builder.setupOS2()
+    builder.setupPost()
+    cmap = builder.font["cmap"]
+    cmap.tables = [table for table in cmap.tables if table.platformID in platform_ids]
+    builder.save(str(path))
+    return str(path)
+
+
+def _pdf_with_text() -> bytes:
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Hello world", fontname="helv")
+    try:
+        return doc.tobytes()
+    finally:
+        doc.close()
+
+
+def test_extract_font_info_reports_first_page_fonts() -> None:
+    info = font_manipulator.extract_font_info_from_pdf(_pdf_with_text())
+
+    assert info["fonts"] == [{"key": "/helv", "subtype": "/Type1", "basefont": "/Helvetica"}]
+    assert info["font_names"] == {"/Helvetica"}
+    assert info["has_embedded_fonts"] is False
+
+
+def test_create_remapped_font_leaves_cached_font_untouched(tmp_path) -> None:
+    font_path = _write_font(tmp_path / "test.ttf")
+
+    remapped = TTFont(io.BytesIO(font_manipulator.create_remapped_font(font_path, {"a": "b"})))
+    plain = TTFont(io.BytesIO(font_manipulator.create_remapped_font(font_path, {})))
+
+    assert remapped.getBestCmap()[ord("a")] == "b"
+    assert plain.getBestCmap()[ord("a")] == "a"
+    assert font_manipulator._load_font(font_path).getBestCmap()[ord("a")] == "a"
+
+
+def test_analyze_font_characters_checks_each_character(tmp_path) -> None:
+    font_path = _write_font(tmp_path / "test.ttf")
+
+    availability = font_manipulator.analyze_font_characters(font_path, {"a", "b", "z", "ab"})
+
+    assert availability == {"a": True, "b": True, "z": False, "ab": False}
+
+
+def test_font_without_windows_cmap_uses_unicode_platform(tmp_path) -> None:
+    font_path = _write_font(tmp_path / "unicode_only.ttf", platform_ids=(0,))
+
+    remapped = TTFont(io.BytesIO(font_manipulator.create_remapped_font(font_path, {"a": "b"})))
+
+    assert font_manipulator.analyze_font_characters(font_path, {"a", "z"}) == {"a": True, "z": False}
+    assert remapped["cmap"].getcmap(0, 3).cmap[ord("a")] == "b"
+
+
+def test_embed_font_in_pdf_replaces_first_font_with_artifact(tmp_path) -> None:
+    font_path = _write_font(tmp_path / "test.ttf")
+    artifact = font_manipulator.create_remapped_font_artifact(font_path, {"a": "b"})
+
+    output = font_manipulator.embed_font_in_pdf(_pdf_with_text(), artifact, {"a": "b"})
+
+    doc = fitz.open(stream=output, filetype="pdf")
+    try:
+        fonts = doc[0].get_fonts(full=True)
+        descriptor = doc.xref_get_key(fonts[0][0], "FontDescriptor")[1]
+        assert [(font[3], font[4]) for font in fonts] == [("RemappedFont", "helv")]
+        assert doc.xref_get_key(int(descriptor.split()[0]), "Ascent") == ("int", str(artifact.ascent))
+    finally:
+        doc.close()
+
+
+def test_character_mapping_prefers_words_with_frequent_letters() -> None:
+    mappings = font_manipulator.create_character_mapping_from_words(
+        {"noon": "moon", "nab": "cab", "dog": "doge", "cat": "bat"}
+    )
+
+    # "cat" (t) and "nab" (a) outrank "noon" (o), so n -> c wins over n -> m
+    assert mappings == {"c": "b", "n": "c"}
+
+
+def test_character_mapping_pairs_unmatched_characters_by_frequency() -> None:
+    mappings = font_manipulator.create_character_mapping_from_words({"zero": "qtroo"})
+
+    # Unmatched {e, z} and {t, q}: the frequent letters pair up, as do the rare ones
+    assert mappings == {"e": "t", "z": "q"}
+
+
+def test_select_best_font_matches_pdf_font_names(monkeypatch) -> None:
+    available = {"DejaVuSans": "/fonts/DejaVuSans.ttf", "Helvetica": "/fonts/Helvetica.ttc"}
+    monkeypatch.setattr(font_manipulator, "get_available_fonts", lambda: dict(available))
+
+    assert font_manipulator.select_best_font_for_pdf(_pdf_with_text()) == "/fonts/Helvetica.ttc"
+
+
+def test_remapped_font_artifact_reused_for_same_mapping(tmp_path) -> None:
+    font_path = _write_font(tmp_path / "test.ttf")
+
+    first = font_manipulator.create_remapped_font_artifact(font_path, {"a": "b"})
+
+    assert font_manipulator.create_remapped_font_artifact(font_path, {"a": "b"}) is first
+    assert font_manipulator.create_remapped_font_artifact(font_path, {"b": "a"}) is not first
+
+
+def test_remapping_never_modifies_the_shared_font(tmp_path, monkeypatch) -> None:
+    font_path = _write_font(tmp_path / "shared.ttf")
+    cached = font_manipulator._load_font(font_path)
+    originals = {id(table): table.cmap for table in cached["cmap"].tables}
+    write = font_manipulator._write_with_new_cmap
+
+    def checked_write(font, *args):
+        # Another thread reading the cached font mid-write must see the original cmaps
+        assert all(table.cmap is originals[id(table)] for table in font["cmap"].tables)
+        return write(font, *args)
+
+    monkeypatch.setattr(font_manipulator, "_write_with_new_cmap", checked_write)
+    mappings = [{"a": "b"}, {"b": "a"}, {}, {"a": "b", "b": "a"}] * 4
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        outputs = list(pool.map(lambda mapping: font_manipulator.create_remapped_font(font_path, mapping), mappings))
+
+    for mapping, output in zip(mappings, outputs):
+        cmap = TTFont(io.BytesIO(output)).getBestCmap()
+        assert (cmap[ord("a")], cmap[ord("b")]) == (mapping.get("a", "a"), mapping.get("b", "b"))
+    assert font_manipulator.analyze_font_characters(font_path, {"a", "b"}) == {"a": True, "b": True}
@@ -0,0 +1,31 @@
+"""Tests for buffering in ``PDFProcessingLogger``."""
+
+from __future__ import annotations
+
+import logging.handlers
+
+import glyph_mapper.logger as logger_module
+
+
+def test_only_debug_records_wait_for_a_flush(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(logger_module, "LOGS_DIR", tmp_path)
+    monkeypatch.setattr(logger_module, "RUNS_DIR", tmp_path)
+    run = logger_module.PDFProcessingLogger("buffer_test")
+    log_file = tmp_path / "pdf_processing_buffer_test.log"
+    try:
+        run.logger.debug("per-operation detail")
+        assert "per-operation detail" not in log_file.read_text(encoding="utf-8")
+
+        run.logger.warning("early exit")
+        contents = log_file.read_text(encoding="utf-8")
+        assert contents.index("per-operation detail") < contents.index("early exit")
+
+        run.logger.debug("trailing detail")
+        run.flush()
+        assert "trailing detail" in log_file.read_text(encoding="utf-8")
+    finally:
+        for handler in run.logger.handlers:
+            if isinstance(handler, logging.handlers.MemoryHandler):
+                handler.target.close()
+            handler.close()
+        run.logger.handlers.clear()
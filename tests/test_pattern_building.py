@@ -0,0 +1,75 @@
+"""Tests for the mapping-key regex built by ``_build_pattern``."""
+
+from __future__ import annotations
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+import glyph_mapper.pdf_processor as pdf_processor
+
+
+WORDS = ["dog.", "dogs", "dog .", "dog", "the", "then", "Them", "0.9:", "a+b", "fi"]
+TEXT = "The dogs, then THEM: a dog . 0.9: dog.dogs a+b fi the. thence DOG"
+
+
+def _flat_alternation(words, flags):
+    ordered = sorted(set(words), key=len, reverse=True)
+    return re.compile("|".join(re.escape(word) for word in ordered), flags)
+
+
+@pytest.mark.parametrize("ignore_case", [True, False])
+def test_trie_pattern_matches_like_longest_first_alternation(ignore_case) -> None:
+    flags = re.IGNORECASE if ignore_case else 0
+    trie = re.compile(pdf_processor._trie_alternation(WORDS, ignore_case=ignore_case), flags)
+    flat = _flat_alternation(WORDS, flags)
+
+    assert [m.span() for m in trie.finditer(TEXT)] == [m.span() for m in flat.finditer(TEXT)]
+
+
+def test_trie_pattern_shares_prefixes() -> None:
+    pattern = pdf_processor._trie_alternation(["then", "them", "the"], ignore_case=True)
+
+    assert pattern == "the(?:n|m)?"
+
+
+def test_build_pattern_reuses_compiled_pattern_for_same_words() -> None:
+    first = pdf_processor._build_pattern(["dog", "then", "the"], ignore_case=True)
+    second = pdf_processor._build_pattern(["the", "dog", "then", "dog"], ignore_case=True)
+
+    assert first is second
+    assert pdf_processor._build_pattern(["dog", "then", "the"]) is not first
+
+
+def test_clear_pattern_cache_drops_compiled_patterns() -> None:
+    pdf_processor._build_pattern(["dog", "then"], ignore_case=True)
+    assert pdf_processor._build_pattern_cached.cache_info().currsize > 0
+
+    pdf_processor.clear_pattern_cache()
+
+    assert pdf_processor._build_pattern_cached.cache_info().currsize == 0
+
+
+def test_rewrite_text_substitutes_resolved_matches(monkeypatch) -> None:
+    quiet_logger = SimpleNamespace(log_replacement_attempt=lambda *args: None)
+    monkeypatch.setattr(pdf_processor, "get_logger", lambda: quiet_logger)
+    mapping = {"dog": "cat", "Then": "Now"}
+    mapping_cf = {key.casefold(): value for key, value in mapping.items()}
+    pattern = re.compile(pdf_processor._trie_alternation(mapping, ignore_case=True), re.IGNORECASE)
+
+    assert pdf_processor._rewrite_text("THEN the DOG, then dogs", pattern, mapping, mapping_cf) == "Now the cat, Now cats"
+    assert pdf_processor._rewrite_text("nothing here", pattern, mapping, mapping_cf) is None
+
+
+def test_segment_text_splits_around_matches(monkeypatch) -> None:
+    noop = lambda *args, **kwargs: None
+    quiet_logger = SimpleNamespace(log_text_segment_analysis=noop, logger=SimpleNamespace(info=noop))
+    monkeypatch.setattr(pdf_processor, "get_logger", lambda: quiet_logger)
+    mapping = {"dog": "cat"}
+    pattern = re.compile(pdf_processor._trie_alternation(mapping, ignore_case=True), re.IGNORECASE)
+
+    segments = pdf_processor._segment_text("a DOG and dog!", pattern, mapping, {"dog": "cat"})
+
+    assert segments == [("a ", None), ("DOG", "cat"), (" and ", None), ("dog", "cat"), ("!", None)]
+    assert pdf_processor._segment_text("birds", pattern, mapping, {"dog": "cat"}) is None
@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import io
+import os
 from types import SimpleNamespace
 
+import fitz  # PyMuPDF
+import pytest
+from PyPDF2 import PdfReader
+from PyPDF2.generic import ContentStream
+
 from glyph_mapper.pdf_processor import OverlayTarget
 
 import glyph_mapper.pdf_processor as pdf_processor
@@ -67,6 +74,14 @@ def test_apply_word_mapping_routes_to_ocr(monkeypatch) -> None:
     assert dummy_logger.finalized is True
 
 
+def test_apply_word_mapping_finalizes_run_without_valid_mappings(monkeypatch) -> None:
+    dummy_logger = DummyLogger()
+    monkeypatch.setattr(pdf_processor, "get_logger", lambda: dummy_logger)
+
+    assert pdf_processor.apply_word_mapping(b"%PDF-1.7\n", {" ": "x"}) == b"%PDF-1.7\n"
+    assert dummy_logger.finalized is True
+
+
 def test_overlay_mode_applies_captured_overlays(monkeypatch) -> None:
     """Overlay mode should restore original glyph appearance after rewrites."""
 
@@ -84,7 +99,7 @@ def test_overlay_mode_applies_captured_overlays(monkeypatch) -> None:
     monkeypatch.setattr(
         pdf_processor,
         "_apply_content_stream_mapping",
-        lambda pdf_bytes, clean_mapping: b"%PDF-rewritten",
+        lambda pdf_bytes, clean_mapping, **kwargs: b"%PDF-rewritten",
     )
     monkeypatch.setattr(pdf_processor, "_sanitize_text_layer", lambda data: b"sanitized")
 
@@ -101,3 +116,217 @@ def test_overlay_mode_applies_captured_overlays(monkeypatch) -> None:
     assert result == b"%PDF-overlaid"
     assert captured["args"][0] == b"sanitized"
     assert captured["args"][1] == [target]
+
+
+def test_overlay_targets_capture_each_word_clip() -> None:
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Hello brave world, hello", fontname="helv", fontsize=14)
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    mapping = {"Hello": "Howdy", "world,": "earth,"}
+    mapping_cf = {key.casefold(): value for key, value in mapping.items()}
+    targets, discovered = pdf_processor._collect_overlay_targets(pdf_bytes, mapping, mapping_cf)
+
+    assert discovered == {"Hello": "Howdy", "world,": "earth,", "hello": "Howdy"}
+    reference = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        for target in targets:
+            clip = reference[target.page].get_pixmap(clip=fitz.Rect(*target.rect), dpi=220, alpha=False)
+            assert (target.image.width, target.image.height) == (clip.width, clip.height)
+            assert target.image.samples == clip.samples
+    finally:
+        reference.close()
+
+
+def test_overlay_targets_match_between_serial_and_process_pool(monkeypatch) -> None:
+    doc = fitz.open()
+    for text in ("Hello there", "nothing here", "hello world"):
+        doc.new_page().insert_text((72, 72), text, fontname="helv", fontsize=14)
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    mapping = {"Hello": "Howdy"}
+    mapping_cf = {"hello": "Howdy"}
+    serial = pdf_processor._collect_overlay_targets(pdf_bytes, mapping, mapping_cf)
+
+    monkeypatch.setattr(pdf_processor, "_OVERLAY_PARALLEL_MIN_PAGES", 2)
+    monkeypatch.setattr(pdf_processor.os, "cpu_count", lambda: 2)
+    parallel = pdf_processor._collect_overlay_targets(pdf_bytes, mapping, mapping_cf)
+
+    assert [target.page for target in serial[0]] == [0, 2]
+    assert parallel[1] == serial[1]
+    assert [(t.page, t.rect, t.image.samples) for t in parallel[0]] == [
+        (t.page, t.rect, t.image.samples) for t in serial[0]
+    ]
+
+
+def test_overlay_targets_skip_pages_without_keys(monkeypatch) -> None:
+    doc = fitz.open()
+    for text in ("Nothing to see", "STRASSE sign", "plain words"):
+        doc.new_page().insert_text((72, 72), text, fontname="helv", fontsize=14)
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    visited = []
+    original = pdf_processor._page_overlay_targets
+
+    def recording(page, page_number, *args):
+        visited.append(page_number)
+        return original(page, page_number, *args)
+
+    monkeypatch.setattr(pdf_processor, "_page_overlay_targets", recording)
+    mapping = {"straße": "road"}
+    mapping_cf = {key.casefold(): value for key, value in mapping.items()}
+    targets, discovered = pdf_processor._collect_overlay_targets(pdf_bytes, mapping, mapping_cf)
+
+    assert visited == [1]
+    assert [target.page for target in targets] == [1]
+    assert discovered == {"STRASSE": "road"}
+
+
+def test_summarise_vocabulary_counts_lists_and_iterables() -> None:
+    word_index = {
+        "alpha": [{"page": 0}],
+        "beta": [{"page": 0}, {"page": 1}],
+        "gamma": iter([{"page": 0}, {"page": 1}]),
+        "delta": [{"page": 2}] * 3,
+    }
+
+    assert pdf_processor.summarise_vocabulary(word_index, top_n=3) == [("delta", 3), ("beta", 2), ("gamma", 2)]
+
+
+def test_word_boxes_agree_between_index_and_overlay_passes() -> None:
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Hello there hello", fontname="helv", fontsize=14)
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    index = pdf_processor.generate_word_occurrences(pdf_bytes)
+    targets, _ = pdf_processor._collect_overlay_targets(pdf_bytes, {"Hello": "Howdy"}, {"hello": "Howdy"})
+
+    assert not hasattr(pdf_processor._document_words, "cache_info")
+    assert sorted(target.rect for target in targets) == sorted(
+        location["rect"] for token in ("Hello", "hello") for location in index[token]
+    )
+
+
+def test_match_ocr_words_skips_used_and_overlapping_windows() -> None:
+    norms = ["the", "big", "dog", "big", "dog", "dog", "big", "the", "big", "dog"]
+    words = [
+        pdf_processor.OCRWord(text=norm, norm=norm, rect=fitz.Rect(10 * i, 0, 10 * i + 8, 10), height=10.0)
+        for i, norm in enumerate(norms)
+    ]
+    prepared = [(["big", "dog"], "cat"), (["dog"], "owl"), (["the", "big"], "a")]
+
+    matches = pdf_processor._match_ocr_words(words, prepared)
+
+    assert [(match.replacement, round(match.rect.x0, 1)) for match in matches] == [
+        ("cat", 9.2),
+        ("cat", 29.2),
+        ("cat", 79.2),
+        ("owl", 49.2),
+    ]
+    assert [round(value, 1) for value in matches[0].rect] == [9.2, -0.8, 28.8, 10.8]
+    assert matches[0].font_size == 10.0
+
+
+def _pdf_with_content(stream: bytes) -> bytes:
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "x", fontname="helv")
+    doc.update_stream(page.get_contents()[0], stream)
+    pdf_bytes = doc.tobytes()
+    doc.close()
+    return pdf_bytes
+
+
+def _text_operations(pdf_bytes: bytes):
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    page = reader.pages[0]
+    content = ContentStream(page["/Contents"].get_object(), reader)
+    return [
+        (operator, [str(item) for item in operands[0]] if operator == b"TJ" else str(operands[0]))
+        for operands, operator in content.operations
+        if operator in (b"Tj", b"TJ")
+    ]
+
+
+def test_ocr_mapping_process_pool_hands_rendered_pages_to_ocr(monkeypatch) -> None:
+    doc = fitz.open()
+    for _ in range(8):
+        page = doc.new_page()
+        page.draw_rect(fitz.Rect(0, 0, 20, 20), color=(0, 0, 0), fill=(0, 0, 0))
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    def fake_extract(image, page_rect, scale, min_confidence):
+        # Runs in the pool workers, after _init_ocr_worker pinned Tesseract to one thread
+        assert os.environ.get("OMP_THREAD_LIMIT") == "1"
+        assert image.mode == "RGB"
+        assert image.size == (round(page_rect.width * scale), round(page_rect.height * scale))
+        assert image.getpixel((5, 5)) == (0, 0, 0)
+        assert image.getpixel((image.width - 5, image.height - 5)) == (255, 255, 255)
+        return [pdf_processor.OCRWord(text="Alpha", norm="alpha", rect=fitz.Rect(72, 72, 200, 100), height=10.0)]
+
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    monkeypatch.setattr(pdf_processor, "_extract_ocr_words", fake_extract)
+    monkeypatch.setattr(pdf_processor.os, "cpu_count", lambda: 2)
+
+    result = pdf_processor.apply_image_ocr_mapping(pdf_bytes, {"alpha": "Omega"}, dpi=72)
+
+    with fitz.open(stream=result, filetype="pdf") as remapped:
+        assert [page.get_text().split() for page in remapped] == [["Omega"]] * 8
+
+
+def test_sanitize_drops_empty_text_arrays_and_keeps_the_rest() -> None:
+    pdf_bytes = _pdf_with_content(b"BT /helv 12 Tf 72 72 Td (Hi) Tj [] TJ [(A) -20 (B)] TJ ET")
+
+    sanitized = pdf_processor._sanitize_text_layer(pdf_bytes)
+
+    assert sanitized is not pdf_bytes
+    assert _text_operations(sanitized) == [(b"Tj", "Hi"), (b"TJ", ["A", "-20", "B"])]
+
+
+def test_sanitize_returns_input_when_nothing_to_drop() -> None:
+    pdf_bytes = _pdf_with_content(b"BT /helv 12 Tf 72 72 Td (Hi) Tj [(A) -20 (B)] TJ ET")
+
+    assert pdf_processor._sanitize_text_layer(pdf_bytes) is pdf_bytes
+
+
+def test_normalize_ocr_token_keeps_ascii_alphanumerics_only() -> None:
+    assert pdf_processor._normalize_ocr_token("(Back-Prop²agation),") == "backpropagation"
+    assert pdf_processor._normalize_ocr_token("Straße ﬁx 42") == "straex42"
+    assert pdf_processor._normalize_ocr_token("—“”") == ""
+
+
+@pytest.mark.parametrize(
+    ("content", "mapping", "expected"),
+    [
+        (b"[(Hello) -130 (World)] TJ", {"Hello World": "Howdy Earth"}, ("Howdy", "Earth")),
+        (b"[(co\\014ee)] TJ", {"cofiee": "coffee"}, ("coffee",)),
+    ],
+)
+def test_content_stream_rewrite_matches_kerned_spaces_and_ligatures(monkeypatch, content, mapping, expected) -> None:
+    """Keys spanning a kerning gap or a ligature code are rewritten.
+
+    MuPDF reports these as ``HelloWorld`` and ``co``/``ee``, so the rewrite must
+    not be screened on PyMuPDF's word list.
+    """
+    noop = lambda *args, **kwargs: None
+    quiet_logger = SimpleNamespace(
+        logger=SimpleNamespace(info=noop, debug=noop, warning=noop),
+        log_pattern_building=noop,
+        log_replacement_attempt=noop,
+        log_text_segment_analysis=noop,
+        log_content_stream_operation=noop,
+    )
+    monkeypatch.setattr(pdf_processor, "get_logger", lambda: quiet_logger)
+    pdf_bytes = _pdf_with_content(b"BT /helv 12 Tf 72 72 Td " + content + b" ET")
+
+    rewritten = pdf_processor._apply_content_stream_mapping(pdf_bytes, mapping)
+
+    assert rewritten is not None
+    texts = "".join("".join(text) for _, text in _text_operations(rewritten))
+    assert all(word in texts for word in expected)
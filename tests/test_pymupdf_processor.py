@@ -0,0 +1,71 @@
+"""Tests for the PyMuPDF overlay and font replacement path."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import fitz  # PyMuPDF
+import pytest
+
+from glyph_mapper.pymupdf_processor import process_pdf_with_pymupdf
+
+
+FIXTURE_DIR = Path("tests")
+
+
+def _page_words(pdf_bytes: bytes, page_number: int) -> list[str]:
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        return [word[4] for word in doc[page_number].get_text("words")]
+
+
+@pytest.mark.parametrize("mode", ["overlay", "font"])
+def test_sample_words_are_replaced(mode: str) -> None:
+    source = (FIXTURE_DIR / "sample.pdf").read_bytes()
+
+    result = process_pdf_with_pymupdf(source, {"dogs": "owls", "quick": "slow"}, mode=mode)
+
+    with fitz.open(stream=result, filetype="pdf") as doc:
+        assert doc[0].get_text() == (
+            "The slow brown fox jumps over the lazy dog.\n"
+            "Cats chase mice while owls guard houses.\n"
+        )
+
+
+def test_overlay_keeps_every_redrawn_line_on_the_page() -> None:
+    # Redacting one overlay at a time used to wipe the text redrawn for the
+    # overlays before it; only the last lines of each slide survived.
+    source = (FIXTURE_DIR / "CSE_576_Attention.pdf").read_bytes()
+
+    result = process_pdf_with_pymupdf(source, {"Attention": "Retention", "the": "an"}, mode="overlay")
+
+    words = _page_words(result, 1)
+    assert words.count("Retention") == 2
+    assert "Attention" not in words
+    for word in ("Core", "idea", "direct", "connection", "encoder", "particular"):
+        assert word in words
+
+
+@pytest.mark.parametrize("mode", ["overlay", "font"])
+def test_redactions_are_applied_once_per_page(monkeypatch, mode: str) -> None:
+    doc = fitz.open()
+    for _ in range(2):
+        page = doc.new_page()
+        page.insert_text((72, 72), "alpha beta", fontname="helv")
+        page.insert_text((72, 100), "beta gamma", fontname="helv")
+    source = doc.tobytes()
+    doc.close()
+
+    calls = []
+    original = fitz.Page.apply_redactions
+
+    def counting_apply(self, *args, **kwargs):
+        calls.append(self.number)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(fitz.Page, "apply_redactions", counting_apply)
+
+    result = process_pdf_with_pymupdf(source, {"beta": "delta"}, mode=mode)
+
+    assert calls == [0, 1]
+    for page_number in range(2):
+        assert _page_words(result, page_number) == ["alpha", "delta", "delta", "gamma"]
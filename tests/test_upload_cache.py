@@ -0,0 +1,39 @@
+"""Tests for the in-process upload store used between ``/analyze`` and ``/remap``."""
+
+from __future__ import annotations
+
+from app import PDFUploadCache
+
+
+def test_total_size_bound_evicts_oldest_uploads() -> None:
+    cache = PDFUploadCache(max_entries=10, max_bytes=10)
+
+    first = cache.put(b"a" * 4)
+    second = cache.put(b"b" * 4)
+    third = cache.put(b"c" * 4)
+
+    assert cache.get(first) is None
+    assert cache.get(second) == b"b" * 4
+    assert cache.get(third) == b"c" * 4
+
+
+def test_oversized_upload_is_still_kept() -> None:
+    cache = PDFUploadCache(max_bytes=10)
+
+    small = cache.put(b"a" * 4)
+    large = cache.put(b"b" * 20)
+
+    assert cache.get(small) is None
+    assert cache.get(large) == b"b" * 20
+
+
+def test_pop_releases_the_upload() -> None:
+    cache = PDFUploadCache(max_entries=10, max_bytes=10)
+
+    token = cache.put(b"a" * 8)
+    cache.pop(token)
+    cache.pop(token)
+    kept = cache.put(b"b" * 8)
+
+    assert cache.get(token) is None
+    assert cache.get(kept) == b"b" * 8